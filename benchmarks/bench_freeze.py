@@ -0,0 +1,68 @@
+"""
+Compare memory footprint and lookup latency of plain dicts and `th.freeze` documents.
+
+Usage: PYTHONPATH=. python3 benchmarks/bench_freeze.py [number of documents]
+"""
+import gc
+import sys
+import tracemalloc
+from timeit import repeat
+from typing import Any, Callable, Dict, List, Tuple
+
+import th
+from th import _
+
+
+def make_document(i: int) -> Dict[str, Any]:
+    return {
+        "id": i,
+        "status": "active",
+        "user": {"id": i, "name": f"user{i}", "email": f"user{i}@example.com", "age": i % 90},
+        "tags": ["a", "b", "c"],
+        "items": [{"sku": f"sku{j}", "qty": j, "price": j * 1.5} for j in range(5)],
+    }
+
+
+def measure(build: Callable[[], List[Any]]) -> Tuple[List[Any], int]:
+    gc.collect()
+    tracemalloc.start()
+    documents = build()
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return documents, size
+
+
+def bench_lookup(name: str, documents: List[Any], number: int = 20) -> None:
+    path = _["items"][3]["price"]
+    compiled = th.compile(path)
+
+    def run_get() -> None:
+        for doc in documents:
+            th.get(doc, path)
+
+    def run_compiled() -> None:
+        for doc in documents:
+            compiled(doc)
+
+    for label, func in (("th.get", run_get), ("compiled", run_compiled)):
+        best = min(repeat(func, number=number, repeat=3)) / number / len(documents)
+        print(f"  {name:<8} {label:<9} {best * 1e9:8.1f} ns/lookup")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+
+    raw, raw_size = measure(lambda: [make_document(i) for i in range(count)])
+    frozen, frozen_size = measure(lambda: [th.freeze(make_document(i)) for i in range(count)])
+
+    print(f"{count} documents")
+    print(f"  dict     {raw_size / count:8.0f} bytes/document")
+    print(f"  frozen   {frozen_size / count:8.0f} bytes/document "
+          f"({frozen_size / raw_size:.0%} of dict)")
+
+    bench_lookup("dict", raw)
+    bench_lookup("frozen", frozen)
+
+
+if __name__ == "__main__":
+    main()
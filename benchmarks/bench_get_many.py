@@ -0,0 +1,58 @@
+"""
+Measure how `th.get_many` scales with the number of worker threads.
+
+Two workloads are resolved: properties that block on (simulated) I/O, which scale on any
+CPython build, and CPU-bound properties, which only scale on free-threaded builds
+(e.g. `python3.13t`).
+
+Usage: PYTHONPATH=. python3 benchmarks/bench_get_many.py [number of objects]
+"""
+import sys
+import sysconfig
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import th
+from th import _
+
+
+class IOResource:
+    @property
+    def body(self) -> Dict[str, Any]:
+        time.sleep(0.001)
+        return {"id": 1}
+
+
+class CPUResource:
+    @property
+    def body(self) -> Dict[str, Any]:
+        return {"id": sum(i * i for i in range(5_000))}
+
+
+def bench(name: str, objs: List[Any]) -> None:
+    path = th.compile(_.body["id"])
+    baseline = 0.0
+    for workers in (1, 2, 4, 8):
+        with ThreadPoolExecutor(workers) as executor:
+            started = time.perf_counter()
+            th.get_many(objs, path, executor=executor, max_in_flight=workers * 2)
+            elapsed = time.perf_counter() - started
+        baseline = baseline or elapsed
+        print(f"  {name:<4} {workers} workers {elapsed * 1000:8.1f} ms "
+              f"(x{baseline / elapsed:.2f})")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    gil_disabled = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"{sys.version.split()[0]}, free-threaded build: {gil_disabled}, "
+          f"GIL enabled: {gil_enabled}")
+
+    bench("io", [IOResource() for _i in range(count)])
+    bench("cpu", [CPUResource() for _i in range(count)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Measure the cold-start cost of `import th` with `python -X importtime`.
+
+Usage: PYTHONPATH=. python3 benchmarks/bench_import.py [number of runs]
+"""
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from statistics import median
+from typing import Dict, List
+
+
+def import_times(statement: str) -> Dict[str, int]:
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            env=dict(os.environ), capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self, cumulative, package = line[len("import time:"):].split("|")
+        # Nested imports are indented; keep the indentation to tell top-level imports apart
+        times[package[1:].rstrip()] = int(cumulative)
+    return times
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    for statement in ("import th", "import th; th.compile, th.first, th.get_many"):
+        samples: Dict[str, List[int]] = defaultdict(list)
+        for _run in range(runs):
+            for package, cumulative in import_times(statement).items():
+                samples[package].append(cumulative)
+        total = sum(median(samples[x]) for x in samples if not x.startswith(" "))
+        print(f"{statement}: {total / 1000:.1f} ms of imports incl. startup "
+              f"(median of {runs} runs)")
+        slowest = sorted(samples, key=lambda x: median(samples[x]), reverse=True)[:8]
+        for package in slowest:
+            print(f"  {median(samples[package]) / 1000:6.1f} ms  {package.strip()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Compare `th.get` with lookups through `th.index` on a static document.
+
+Usage: PYTHONPATH=. python3 benchmarks/bench_index.py [number of lookups]
+"""
+import sys
+import timeit
+
+import th
+from th import _
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    doc = {"catalog": {"products": [{"sku": f"s{i}", "price": {"amount": i}}
+                                    for i in range(1_000)]}}
+    index = th.index(doc)
+    path = _["catalog"]["products"][42]["price"]["amount"]
+
+    cases = {
+        "th.get (same path)": lambda: th.get(doc, path),
+        "th.get (new path)": lambda: th.get(doc, _["catalog"]["products"][42]["price"]["amount"]),
+        "index (same path)": lambda: index.get(path),
+        "index (new path)": lambda: index.get(_["catalog"]["products"][42]["price"]["amount"]),
+    }
+    for name, func in cases.items():
+        elapsed = min(timeit.repeat(func, number=number, repeat=5))
+        print(f"{name:<19} {elapsed / number * 1e9:8.0f} ns per lookup")
+    print(f"index: {index.info()}")
+
+
+if __name__ == "__main__":
+    main()
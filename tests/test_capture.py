@@ -0,0 +1,141 @@
+from unittest.mock import patch
+
+from pytest import raises
+
+import th
+from th import _, _resolver
+
+
+def fail(obj, path, **kwargs):
+    with raises(th.Error):
+        th.get(obj, path, **kwargs)
+
+
+def test_capture_records_failure():
+    with th.capture() as capture:
+        fail({"body": {"users": None}}, _["body"]["users"][0]["name"])
+
+    record, = capture.dump()
+    assert record.path == "_['body']['users'][0]['name']"
+    assert record.step_index == 2
+    assert record.step == "[0]"
+    assert record.error == "TypeError"
+    assert record.type_name == "NoneType"
+    assert record.snapshot == "None"
+
+
+def test_capture_snapshot_is_bounded():
+    obj = {"items": {f"key{i}": "x" * 1000 for i in range(1000)}}
+
+    with th.capture(snapshot_size=64) as capture:
+        fail(obj, _["items"]["missing"])
+
+    record, = capture.dump()
+    assert len(record.snapshot) <= 64
+    assert record.snapshot.startswith("{'key0': 'xxx")
+
+
+def test_capture_ring_buffer():
+    with th.capture(maxlen=2) as capture:
+        for key in ("a", "b", "c"):
+            fail({}, _[key])
+
+    assert [x.path for x in capture.dump()] == ["_['b']", "_['c']"]
+    assert capture.info()["failures"] == 3
+
+
+def test_capture_dump_clear():
+    with th.capture() as capture:
+        fail({}, _["a"])
+
+    assert len(capture.dump(clear=True)) == 1
+    assert capture.dump() == []
+
+
+def test_capture_sample_rate():
+    with th.capture(sample_rate=0.5) as capture:
+        with patch("th._capture.random", side_effect=[0.7, 0.2]):
+            fail({}, _["a"])
+            fail({}, _["b"])
+
+    assert [x.path for x in capture.dump()] == ["_['b']"]
+    assert capture.info()["sampled_out"] == 1
+
+
+def test_capture_rate_limit():
+    with th.capture(rate_limit=2, per_seconds=60.0) as capture:
+        for _attempt in range(5):
+            fail({}, _["a"])
+        fail({}, _["b"])
+
+    assert [x.path for x in capture.dump()] == ["_['a']", "_['a']", "_['b']"]
+    assert capture.info()["rate_limited"] == 3
+
+
+def test_capture_rate_limit_window():
+    with th.capture(rate_limit=1, per_seconds=10.0) as capture:
+        with patch("th._capture.monotonic", side_effect=[100.0, 105.0, 111.0]):
+            for _attempt in range(3):
+                fail({}, _["a"])
+
+    assert len(capture.dump()) == 2
+
+
+def test_capture_default_not_recorded():
+    with th.capture() as capture:
+        th.get({}, _["a"], default=None)
+
+    assert capture.dump() == []
+
+
+def test_capture_first_fallback_not_recorded():
+    with th.capture() as capture:
+        assert th.first({"b": 1}, _["a"], _["b"]) == 1
+
+    assert capture.dump() == []
+
+
+def test_capture_first_failure():
+    with th.capture() as capture:
+        with raises(th.LookupError):
+            th.first({}, _["a"], _["b"])
+
+    assert [x.path for x in capture.dump()] == ["_['a']", "_['b']"]
+
+
+def test_capture_stop():
+    capture = th.capture()
+    assert capture.active
+
+    capture.stop()
+    fail({}, _["a"])
+
+    assert not capture.active
+    assert capture.dump() == []
+    assert _resolver._failure_hook is None
+
+
+def test_capture_replaces_active_capture():
+    first = th.capture()
+    second = th.capture()
+    fail({}, _["a"])
+    first.stop()
+    fail({}, _["b"])
+    second.stop()
+
+    assert not first.active
+    assert first.dump() == []
+    assert [x.path for x in second.dump()] == ["_['a']", "_['b']"]
+
+
+def test_capture_off_by_default():
+    assert _resolver._failure_hook is None
+
+
+def test_capture_invalid_arguments():
+    with raises(ValueError):
+        th.capture(maxlen=0)
+    with raises(ValueError):
+        th.capture(sample_rate=1.5)
+    with raises(ValueError):
+        th.capture(rate_limit=0)
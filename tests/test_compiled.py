@@ -0,0 +1,211 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, TypedDict
+from unittest.mock import sentinel as s
+
+from pytest import raises
+
+import th
+from th import _
+
+
+def test_compiled_resolve():
+    path = th.compile(_.body["users"][0])
+
+    class Response:
+        body = {"users": ["Bob"]}
+
+    assert path(Response) == "Bob"
+
+
+def test_compiled_default():
+    path = th.compile(_["users"][0])
+
+    assert path({"users": []}, default=s.default) == s.default
+
+
+def test_compiled_snapshot():
+    holder = _["users"]
+    path = th.compile(holder)
+    holder[0]
+
+    assert path({"users": [1]}) == [1]
+
+
+def test_compiled_repr():
+    assert repr(th.compile(_.body["users"])) == "CompiledPath(_.body['users'])"
+
+
+def test_compiled_len():
+    assert len(th.compile(_.body["users"][0])) == 3
+
+
+def test_compiled_path():
+    assert th.compile(_.body["users"]).path == _.body["users"]
+
+
+def test_compiled_lookup():
+    path = th.compile(_["body"]["user_id"], lookup="normalize")
+
+    assert path({"body": {"userId": 1}}) == 1
+    assert path({"body": {"UserID": 2}}) == 2
+
+
+def test_compiled_errors_match_get():
+    cases = [
+        (None, _.body["items"][0]),
+        ({"items": [1, 2, 3]}, _["items"][10]),
+        ({"result": {}}, _["result"]["items"]),
+        ({"status": "OK"}, _["status"][None]),
+        ({"status": 200}, _["status"][0]),
+    ]
+    for obj, holder in cases:
+        with raises(th.Error) as expected:
+            th.get(obj, holder, verbose=True)
+        with raises(th.Error) as actual:
+            th.compile(holder)(obj, verbose=True)
+
+        assert type(actual.value) is type(expected.value)
+        assert repr(actual.value) == repr(expected.value)
+
+
+@dataclass
+class Body:
+    user: "User"
+    tags: List[str]
+    pair: Tuple[int, str]
+    extra: Optional[Dict[str, Any]] = None
+
+
+class User(TypedDict):
+    id: int
+
+
+class Response(NamedTuple):
+    status: int
+    body: Body
+
+
+def test_compiled_schema_guaranteed():
+    assert th.compile(_.status, schema=Response).guaranteed == 1
+    assert th.compile(_.body.user["id"], schema=Response).guaranteed == 3
+    assert th.compile(_.body.pair[1], schema=Response).guaranteed == 3
+    assert th.compile(_.body.tags[0], schema=Response).guaranteed == 2
+    assert th.compile(_.body.extra["key"], schema=Response).guaranteed == 2
+    assert th.compile(_.body.user["id"]).guaranteed == 0
+
+
+def test_compiled_schema_resolve():
+    path = th.compile(_.body.user["id"], schema=Response)
+    response = Response(200, Body({"id": 1}, [], (1, "a")))
+
+    assert path(response) == 1
+
+
+def test_compiled_schema_mismatch():
+    path = th.compile(_.body.user["id"], schema=Response)
+    response = Response(200, Body({}, [], (1, "a")))  # type: ignore
+
+    with raises(th.KeyError) as exc_info:
+        path(response)
+
+    assert str(exc_info.value) == "\n".join([
+        "_.body.user['id']",
+        "                         ^^^^ does not exist",
+    ])
+    assert path(response, default=s.default) == s.default
+
+
+def test_compiled_schema_attribute_error():
+    with raises(th.AttributeError) as exc_info:
+        th.compile(_.bdy.users, schema=Response)
+
+    assert str(exc_info.value) == "\n".join([
+        "_.bdy.users",
+        "                     ^^^ does not exist in Response",
+    ])
+    assert exc_info.value.index == 0
+    assert exc_info.value.type_name == "Response"
+
+
+def test_compiled_schema_key_error():
+    with raises(th.KeyError) as exc_info:
+        th.compile(_.body.user["ID"], schema=Response)
+
+    assert str(exc_info.value) == "\n".join([
+        "_.body.user['ID']",
+        "                         ^^^^ does not exist in User",
+    ])
+
+
+def test_compiled_schema_index_error():
+    with raises(th.IndexError) as exc_info:
+        th.compile(_.body.pair[2], schema=Response)
+
+    assert str(exc_info.value) == "\n".join([
+        "_.body.pair[2]",
+        "                           ^ out of range for Tuple[int, str]",
+    ])
+
+
+def test_compiled_schema_type_error():
+    with raises(th.TypeError) as exc_info:
+        th.compile(_.status[0], schema=Response)
+
+    assert str(exc_info.value) == "\n".join([
+        "_.status[0]",
+        "              ^^^^^^^^ inappropriate type (int)",
+    ])
+
+
+def test_compiled_schema_unknown():
+    path = th.compile(_.body.extra["key"].anything[0], schema=Response)
+
+    assert path.guaranteed == 2
+
+
+def test_compiled_schema_annotated_class_is_open():
+    class Point:
+        x: int
+
+        def __init__(self, x: int, y: int) -> None:
+            self.x = x
+            self.y = y
+
+    path = th.compile(_.y, schema=Point)
+
+    assert path.guaranteed == 0
+    assert path(Point(1, 2)) == 2
+    assert th.compile(_.x, schema=Point).guaranteed == 1
+
+
+def test_compiled_schema_slots_class_is_closed():
+    class Point:
+        __slots__ = ("x",)
+        x: int
+
+    with raises(th.AttributeError):
+        th.compile(_.y, schema=Point)
+
+
+def test_compiled_schema_dataclass_is_open():
+    @dataclass
+    class Status:
+        code: int
+
+        def __post_init__(self) -> None:
+            self.ok = self.code < 400
+
+    path = th.compile(_.ok, schema=Status)
+
+    assert path.guaranteed == 0
+    assert path(Status(200)) is True
+
+
+def test_compiled_schema_index_like_key():
+    path = th.compile(_.body.tags[True], schema=Response)
+    assert path.guaranteed == 2
+    assert path(Response(200, Body({"id": 1}, ["a", "b"], (1, "a")))) == "b"
+
+    assert th.compile(_.body.pair[True], schema=Response).guaranteed == 2
+    with raises(th.TypeError):
+        th.compile(_.body.tags["0"], schema=Response)
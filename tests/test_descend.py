@@ -0,0 +1,98 @@
+import sys
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from pytest import raises
+
+import th
+from th import _
+
+
+def make_doc():
+    return {
+        "body": {
+            "id": 1,
+            "items": [{"id": 2, "meta": {"id": 3}}, {"extra": {"id": 4}}],
+            "owner": {"id": 5},
+        },
+    }
+
+
+def test_descend():
+    assert list(th.get(make_doc(), _["body"][th.descend("id")])) == [1, 2, 3, 4, 5]
+
+
+def test_descend_lazy():
+    values = th.get(make_doc(), _["body"][th.descend("id")])
+
+    assert next(values) == 1
+    assert next(values) == 2
+
+
+def test_descend_no_matches():
+    assert list(th.get(make_doc(), _["body"][th.descend("name")])) == []
+
+
+def test_descend_max_depth():
+    path = _["body"][th.descend("id", max_depth=2)]
+
+    assert list(th.get(make_doc(), path)) == [1, 5]
+
+
+def test_descend_keys():
+    path = _["body"][th.descend("id", keys=["items", 0])]
+
+    assert list(th.get(make_doc(), path)) == [1, 2]
+
+
+def test_descend_types():
+    path = _["body"][th.descend("id", types=[dict])]
+
+    assert list(th.get(make_doc(), path)) == [1, 5]
+
+
+def test_descend_objects():
+    @dataclass
+    class Node:
+        id: int
+        child: Optional[Any] = None
+
+    root = Node(1, Node(2, [Node(3)]))
+
+    assert list(th.get(root, _[th.descend("id", types=[Node, list])])) == [1, 2, 3]
+
+
+def test_descend_cycles():
+    doc: Any = {"id": 1}
+    doc["self"] = doc
+    doc["items"] = [doc, {"id": 2}]
+
+    assert list(th.get(doc, _[th.descend("id")])) == [1, 2]
+
+
+def test_descend_deep():
+    depth = sys.getrecursionlimit() * 2
+    doc = node = {}
+    for index in range(depth):
+        node["next"] = node = {"id": index}
+
+    assert sum(1 for _value in th.get(doc, _[th.descend("id")])) == depth
+
+
+def test_descend_repr():
+    assert repr(_.body[th.descend("id")]) == "_.body[th.descend('id')]"
+    assert repr(_[th.descend("id", max_depth=2, types=[dict], keys=["a"])]) == \
+        "_[th.descend('id', max_depth=2, types=(dict,), keys=['a'])]"
+
+
+def test_descend_type_error():
+    with raises(th.TypeError) as exc_info:
+        th.get({"body": None}, _["body"][th.descend("id")])
+
+    assert repr(exc_info.value) == "th.TypeError: _['body'][th.descend('id')]\n" \
+                                   "              ^^^^^^^^^ inappropriate type (NoneType)"
+
+
+def test_descend_invalid_max_depth():
+    with raises(ValueError):
+        th.descend("id", max_depth=0)
@@ -1,4 +1,10 @@
+import gc
+import pickle
+import tracemalloc
+import weakref
+from functools import partial
 from traceback import format_exception
+from typing import Any, Callable
 
 from pytest import raises
 
@@ -134,3 +140,168 @@ def test_type_error_subscriptable_verbose():
 
     tb = "".join(format_exception(exc.type, exc.value, exc.tb))
     assert tb.endswith(exception + "\n")
+
+
+def test_error_metadata():
+    with raises(th.KeyError) as exc:
+        get({"result": {}}, _["result"]["items"])
+
+    assert exc.value.path == "_['result']['items']"
+    assert exc.value.index == 1
+    assert exc.value.type_name == "dict"
+    assert isinstance(exc.value.suppressed, KeyError)
+
+
+def test_error_pickle():
+    with raises(th.KeyError) as exc:
+        get({"result": {}}, _["result"]["items"], lightweight=True)
+
+    error = pickle.loads(pickle.dumps(exc.value))
+    assert type(error) is th.KeyError
+    assert repr(error) == repr(exc.value)
+    assert error.index == 1
+
+
+def test_lightweight_error():
+    exception = "th.KeyError: _['result']['items']\n" \
+                "                         ^^^^^^^ does not exist"
+
+    with raises(th.KeyError) as exc:
+        get({"result": {}}, _["result"]["items"], lightweight=True)
+
+    assert repr(exc.value) == exception
+    assert exc.value.suppressed is None
+    assert exc.value.__context__ is None
+    assert exc.value.path == "_['result']['items']"
+    assert exc.value.index == 1
+    assert exc.value.type_name == "dict"
+
+
+def test_lightweight_error_verbose():
+    with raises(th.KeyError) as exc:
+        get({"result": {}, "items": list(range(1000))}, _["result"]["items"],
+            verbose=True, lightweight=True)
+
+    assert exc.value.message.endswith("\nwhere _ is <class 'dict'>:\n"
+                                      "{'items': [0, 1, 2, 3, 4, 5, ...], 'result': {}}")
+
+
+class Payload:
+    instances: "weakref.WeakSet[Payload]" = weakref.WeakSet()
+
+    def __init__(self):
+        self.data = bytearray(10 * 1024 * 1024)
+        self.instances.add(self)
+
+    @property
+    def body(self):
+        return self.data[None]
+
+
+def _resolve(resolve: Callable[[Any], Any]) -> th.Error:
+    try:
+        resolve(Payload())
+    except th.Error as error:
+        return error
+    raise AssertionError("no error raised")
+
+
+def test_lightweight_error_releases_object():
+    resolvers = [
+        partial(get, path=_.body, lightweight=True),
+        partial(get, path=_.items, lightweight=True),
+        partial(get, path=_.data["key"], verbose=True, lightweight=True),
+        partial(th.compile(_.body), lightweight=True),
+    ]
+    for resolve in resolvers:
+        gc.collect()
+        tracemalloc.start()
+        error = _resolve(resolve)
+        gc.collect()
+        size, _peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert len(Payload.instances) == 0
+        assert size < 1024 * 1024
+        assert error.__traceback__ is not None
+
+
+def test_error_retains_object():
+    error = _resolve(partial(get, path=_.body))
+    gc.collect()
+
+    assert len(Payload.instances) == 1
+
+    del error
+    gc.collect()
+    assert len(Payload.instances) == 0
+
+
+def test_error_message_cache():
+    path = _["result"]["items"][0]
+    for _attempt in range(2):
+        with raises(th.KeyError):
+            get({"result": {}}, path)
+    before = th.error_cache_info()
+
+    with raises(th.KeyError) as exc:
+        get({"result": {}}, path)
+
+    after = th.error_cache_info()
+    assert after["hits"] == before["hits"] + 1
+    assert after["misses"] == before["misses"]
+    assert repr(exc.value) == "th.KeyError: _['result']['items'][0]\n" \
+                              "                         ^^^^^^^ does not exist"
+
+
+def test_error_message_cache_type_name():
+    with raises(th.TypeError) as exc1:
+        get({"status": 200}, _["status"][0])
+    with raises(th.TypeError) as exc2:
+        get({"status": None}, _["status"][0])
+
+    assert str(exc1.value).endswith("inappropriate type (int)")
+    assert str(exc2.value).endswith("inappropriate type (NoneType)")
+
+
+def test_error_message_cache_verbose():
+    with raises(th.KeyError) as exc1:
+        get({"id": 1}, _["result"], verbose=True)
+    with raises(th.KeyError) as exc2:
+        get({"id": 2}, _["result"], verbose=True)
+
+    assert str(exc1.value).endswith("where _ is <class 'dict'>:\n{'id': 1}")
+    assert str(exc2.value).endswith("where _ is <class 'dict'>:\n{'id': 2}")
+
+
+def test_error_message_cache_equal_operands():
+    with raises(th.KeyError) as exc1:
+        get({"a": {}}, _["a"][1])
+    with raises(th.KeyError) as exc2:
+        get({"a": {}}, _["a"][True])
+
+    assert repr(exc1.value) == "th.KeyError: _['a'][1]\n" \
+                               "                    ^ does not exist"
+    assert repr(exc2.value) == "th.KeyError: _['a'][True]\n" \
+                               "                    ^^^^ does not exist"
+
+
+def test_error_message_cache_nested_equal_operands():
+    for operand, other in [((1,), (True,)), (0.0, -0.0)]:
+        with raises(th.KeyError):
+            get({"a": {}}, _["a"][operand])
+        with raises(th.KeyError) as exc:
+            get({"a": {}}, _["a"][other])
+
+        assert str(exc.value) == f"_['a'][{other!r}]\n" \
+                                 f"{' ' * 20}{'^' * len(repr(other))} does not exist"
+
+
+def test_error_message_unhashable_operand():
+    exception = "th.TypeError: _['items'][['id']]\n" \
+                "                         ^^^^^^ inappropriate type (list)"
+
+    with raises(th.TypeError) as exc:
+        get({"items": {}}, _["items"][["id"]])
+
+    assert repr(exc.value) == exception
@@ -0,0 +1,123 @@
+import pickle
+from unittest.mock import sentinel as s
+
+from pytest import raises
+
+import th
+from th import _, first
+
+
+def test_first_existing():
+    obj = {"body": {"data": {"user": s.user}}}
+
+    assert first(obj, _["body"]["data"]["user"], _["body"]["user"]) == s.user
+
+
+def test_first_fallback():
+    obj = {"body": {"user": s.user}}
+
+    assert first(obj, _["body"]["data"]["user"], _["body"]["user"]) == s.user
+
+
+def test_first_fallback_attribute():
+    class Response:
+        user = s.user
+
+    assert first(Response, _.body["user"], _.user) == s.user
+
+
+def test_first_property_error():
+    class Response:
+        @property
+        def user(self):
+            return {}["user"]
+
+        @property
+        def profile(self):
+            return len(None)
+
+    assert first(Response(), _.user, _.profile, default=s.default) == s.default
+    with raises(th.LookupError) as exc_info:
+        first(Response(), _.user, _.profile)
+
+    assert [type(x) for x in exc_info.value.errors] == [th.KeyError, th.TypeError]
+
+
+def test_first_falsy_value():
+    assert first({"user": None, "id": 1}, _["user"], _["id"]) is None
+
+
+def test_first_default():
+    assert first({}, _["body"]["user"], _.user, default=s.default) == s.default
+
+
+def test_first_shared_prefix_resolved_once():
+    class Response:
+        calls = 0
+
+        @property
+        def body(self):
+            self.calls += 1
+            return {"user": s.user}
+
+    response = Response()
+    assert first(response, _.body["data"], _.body["profile"], _.body["user"]) == s.user
+    assert response.calls == 1
+
+
+def test_first_fallback_does_not_render_errors():
+    before = th.error_cache_info()
+    assert first({"body": {"user": s.user}}, _["body"]["data"], _["body"]["user"]) == s.user
+
+    after = th.error_cache_info()
+    assert (after["hits"], after["misses"]) == (before["hits"], before["misses"])
+
+
+def test_first_does_not_confuse_equal_operands():
+    class Echo:
+        def __getitem__(self, key):
+            return {"type": type(key)}
+
+    assert first(Echo(), _[1]["name"], _[True]["type"]) is bool
+
+
+def test_first_error():
+    exception = "th.LookupError: none of the paths exist\n" \
+                "  th.TypeError: _['body']['data']['user']\n" \
+                "                ^^^^^^^^^^^^^^^^^ inappropriate type (NoneType)\n" \
+                "  th.KeyError: _['body']['user']\n" \
+                "                         ^^^^^^ does not exist\n" \
+                "  th.AttributeError: _.user\n" \
+                "                       ^^^^ does not exist"
+
+    obj = {"body": {"data": None}}
+    with raises(th.LookupError) as exc:
+        first(obj, _["body"]["data"]["user"], _["body"]["user"], _.user)
+
+    assert repr(exc.value) == exception
+    assert [type(x) for x in exc.value.errors] == [th.TypeError, th.KeyError, th.AttributeError]
+    assert [x.index for x in exc.value.errors] == [2, 1, 0]
+
+
+def test_first_error_verbose():
+    with raises(th.LookupError) as exc:
+        first({"items": [1]}, _["items"][3], verbose=True)
+
+    assert exc.value.message.endswith("\n  th.IndexError: _['items'][3]\n"
+                                      "                            ^ out of range\n"
+                                      "where _ is <class 'dict'>:\n"
+                                      "{'items': [1]}")
+
+
+def test_first_error_is_lookup_error():
+    with raises(LookupError):
+        first({}, _["user"])
+
+
+def test_first_error_pickle():
+    with raises(th.LookupError) as exc:
+        first({}, _["body"]["user"], _["user"])
+
+    error = pickle.loads(pickle.dumps(exc.value))
+    assert repr(error) == repr(exc.value)
+    assert len(error.errors) == 2
@@ -0,0 +1,105 @@
+import pickle
+from copy import deepcopy
+
+from pytest import raises
+
+import th
+from th import FrozenDict, _, freeze, get
+
+
+def test_freeze_mapping():
+    frozen = freeze({"id": 1, "name": "Bob"})
+
+    assert isinstance(frozen, FrozenDict)
+    assert frozen == {"id": 1, "name": "Bob"}
+    assert list(frozen) == ["id", "name"]
+    assert len(frozen) == 2
+    assert "id" in frozen
+    assert "email" not in frozen
+
+
+def test_freeze_nested():
+    frozen = freeze({"users": [{"id": 1, "tags": {"a"}}]})
+
+    assert frozen["users"] == ({"id": 1, "tags": frozenset({"a"})},)
+    assert isinstance(frozen["users"], tuple)
+    assert isinstance(frozen["users"][0], FrozenDict)
+
+
+def test_freeze_scalar():
+    assert freeze(1) == 1
+    assert freeze(None) is None
+
+
+def test_freeze_idempotent():
+    frozen = freeze({"id": 1})
+    assert freeze(frozen) is frozen
+
+
+def test_freeze_shared_key_table():
+    first, second = freeze([{"id": 1, "name": "Bob"}, {"id": 2, "name": "Alice"}])
+    assert first.table is second.table
+
+    other = freeze({"name": "Bob", "id": 1})
+    assert other.table is not first.table
+
+
+def test_freeze_keys_of_other_types():
+    frozen = [freeze({1: "a"}), freeze({True: "b"}), freeze({1.0: "c"}),
+              freeze({(1,): "d"}), freeze({(True,): "e"})]
+
+    assert [repr(next(iter(x))) for x in frozen] == ["1", "True", "1.0", "(1,)", "(True,)"]
+    assert frozen[1] == {True: "b"}
+
+
+def test_frozen_immutable():
+    frozen = freeze({"id": 1})
+
+    with raises(TypeError):
+        frozen["id"] = 2  # type: ignore
+
+    with raises(AttributeError):
+        frozen.extra = 1  # type: ignore
+
+
+def test_frozen_repr():
+    assert repr(freeze({"id": 1})) == "FrozenDict({'id': 1})"
+
+
+def test_frozen_pickle():
+    frozen = freeze({"users": [{"id": 1}]})
+
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+    assert deepcopy(frozen) == frozen
+
+
+def test_get_frozen():
+    frozen = freeze({"users": [{"id": 1}]})
+
+    assert get(frozen, _["users"][0]["id"]) == 1
+
+
+def test_get_frozen_nonexisting_key():
+    exception = "th.KeyError: _['users'][0]['name']\n" \
+                "                           ^^^^^^ does not exist"
+
+    with raises(th.KeyError) as exc:
+        get(freeze({"users": [{"id": 1}]}), _["users"][0]["name"])
+
+    assert repr(exc.value) == exception
+
+
+def test_compiled_frozen():
+    path = th.compile(_["users"][0]["id"])
+    documents = [freeze({"users": [{"id": i}]}) for i in range(3)]
+
+    assert [path(doc) for doc in documents] == [0, 1, 2]
+
+
+def test_compiled_frozen_different_shapes():
+    path = th.compile(_["id"])
+
+    assert path(freeze({"id": 1, "name": "Bob"})) == 1
+    assert path(freeze({"name": "Bob", "id": 2})) == 2
+    assert path({"id": 3}) == 3
+    assert path(freeze({"name": "Bob"}), default=None) is None
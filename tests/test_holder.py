@@ -79,3 +79,13 @@ def test_holder_len():
     holder = _.items[0].name
 
     assert len(holder) == 3
+
+
+def test_holder_hash():
+    assert hash(_.items[0].name) == hash(_.items[0].name)
+    assert {_.items[0]: 1}[_.items[0]] == 1
+    assert _.items[0] not in {_.items[1]: 1}
+
+
+def test_holder_hash_distinct_operators():
+    assert len({_.items, _["items"]}) == 2
@@ -1,3 +1,11 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from pytest import raises
+
+
 def test_import_path_holder():
     from th import PathHolder  # noqa: F401
 
@@ -20,3 +28,83 @@ def test_import_hold():
 
 def test_import_():
     from th import _  # noqa: F401
+
+
+def test_import_compile():
+    from th import CompiledPath, compile  # noqa: F401
+
+
+def test_import_key_lookup():
+    from th import KeyLookup  # noqa: F401
+
+
+def test_import_first():
+    from th import first  # noqa: F401
+
+
+def test_import_get_many():
+    from th import get_many  # noqa: F401
+
+
+def test_import_freeze():
+    from th import FrozenDict, freeze  # noqa: F401
+
+
+def test_import_record_layout():
+    from th import RecordLayout  # noqa: F401
+
+
+def test_import_all():
+    import th
+
+    for name in th.__all__:
+        assert getattr(th, name) is not None
+        assert name in dir(th)
+
+
+def test_import_all_does_not_shadow_builtins():
+    import builtins
+
+    import th
+
+    assert [x for x in th.__all__ if hasattr(builtins, x)] == []
+    assert (th.compile is not None) and (th.set is not None)
+
+
+def test_import_unknown():
+    import th
+
+    with raises(AttributeError):
+        th.unknown
+
+
+def _import_th(*args: str) -> "subprocess.CompletedProcess[str]":
+    root = str(Path(__file__).parent.parent)
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([root, os.environ.get("PYTHONPATH", "")]))
+    return subprocess.run([sys.executable, *args], env=env, capture_output=True, text=True,
+                          check=True)
+
+
+def test_import_is_lazy():
+    script = "import sys, th; print(','.join(sorted(sys.modules)))"
+    modules = _import_th("-c", script).stdout.strip().split(",")
+
+    lazy = {"pprint", "dataclasses", "concurrent.futures", "threading", "struct",
+            "th._compiled", "th._first", "th._many", "th._records", "th._lookup",
+            "th._schema", "th._index", "th._match", "th._descend", "th._capture"}
+    assert lazy.isdisjoint(modules)
+
+
+def test_import_time_budget():
+    budget_us = 100_000
+
+    cumulative = []
+    for _attempt in range(3):
+        stderr = _import_th("-X", "importtime", "-c", "import th").stderr
+        for line in stderr.splitlines():
+            # import time: self [us] | cumulative | imported package
+            _self, total, package = line.split("|")
+            if package.strip() == "th":
+                cumulative.append(int(total))
+
+    assert min(cumulative) < budget_us
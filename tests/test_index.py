@@ -0,0 +1,126 @@
+from unittest.mock import sentinel as s
+
+from pytest import raises
+
+import th
+from th import _
+
+
+def make_doc():
+    return {
+        "flags": {"beta": True, "dark": False},
+        "items": [{"id": 1, "tags": ["a", "b"]}, {"id": 2, "tags": []}],
+        "name": "catalog",
+    }
+
+
+def test_index_get():
+    index = th.index(make_doc())
+
+    assert index[_["items"][0]["tags"][1]] == "b"
+    assert index.get(_["flags"]["beta"]) is True
+    assert index.get(_) == make_doc()
+
+
+def test_index_lazy():
+    index = th.index(make_doc())
+    assert len(index) == 0
+
+    index[_["flags"]["beta"]]
+
+    assert len(index) == 5
+    assert index.info()["expanded"] == 2
+
+
+def test_index_reused_path():
+    index = th.index(make_doc())
+    path = _["items"][1]
+
+    assert index[path] == {"id": 2, "tags": []}
+    assert index[path["id"]] == 2
+
+
+def test_index_unindexed_steps():
+    index = th.index(make_doc())
+
+    assert index[_["items"][-1]["id"]] == 2
+    assert index[_["items"][0:1]] == [{"id": 1, "tags": ["a", "b"]}]
+    assert index[_["name"].upper]() == "CATALOG"
+
+
+def test_index_max_depth():
+    index = th.index(make_doc(), max_depth=1).build()
+
+    assert len(index) == 3
+    assert index[_["items"][1]["id"]] == 2
+    assert len(index) == 3
+
+
+def test_index_default():
+    index = th.index(make_doc())
+
+    assert index.get(_["items"][5], default=s.default) == s.default
+
+
+def test_index_contains():
+    index = th.index(make_doc())
+
+    assert _["flags"]["dark"] in index
+    assert _["flags"]["light"] not in index
+
+
+def test_index_key_error():
+    index = th.index(make_doc())
+
+    with raises(th.KeyError) as exc_info:
+        index[_["flags"]["light"]]
+
+    assert repr(exc_info.value) == "th.KeyError: _['flags']['light']\n" \
+                                   "                        ^^^^^^^ does not exist"
+
+
+def test_index_index_error():
+    index = th.index(make_doc())
+
+    with raises(th.IndexError) as exc_info:
+        index[_["items"][5]["id"]]
+
+    assert repr(exc_info.value) == "th.IndexError: _['items'][5]['id']\n" \
+                                   "                          ^ out of range"
+
+
+def test_index_equal_keys_of_other_types():
+    index = th.index({"items": ["a", "b"], "codes": {1.5: "x", True: "y"}}).build()
+
+    with raises(th.TypeError):
+        index.get(_["items"][1.0])
+    assert index.get(_["items"][True]) == th.get({"items": ["a", "b"]}, _["items"][True])
+    assert index.get(_["codes"][1.5]) == "x"
+    assert index.get(_["codes"][1]) == "y"
+
+
+def test_index_build():
+    index = th.index(make_doc()).build()
+
+    assert len(index) == 13
+    assert index.info()["nbytes"] > 0
+
+
+def test_index_find():
+    index = th.index(make_doc(), reverse=True)
+
+    assert index.find(True) == [_["flags"]["beta"]]
+    assert index.find(1) == [_["items"][0]["id"]]
+    assert th.index({1.5: [None]}, reverse=True).find(None) == [_[1.5][0]]
+    assert index.find("c") == []
+    assert index.find([]) == []
+
+
+def test_index_find_disabled():
+    with raises(ValueError):
+        th.index(make_doc()).find(1)
+
+
+def test_index_invalid_max_depth():
+    with raises(ValueError):
+        th.index(make_doc(), max_depth=-1)
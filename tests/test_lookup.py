@@ -0,0 +1,127 @@
+from sys import getrefcount
+from unittest.mock import sentinel as s
+
+from pytest import raises
+
+import th
+from th import KeyLookup, _, get
+from th._lookup import get_lookup, normalize
+
+
+def test_lookup_exact_key():
+    assert get({"userId": 1}, _["userId"], lookup="normalize") == 1
+
+
+def test_lookup_casefold():
+    assert get({"UserID": 1}, _["userid"], lookup="casefold") == 1
+
+
+def test_lookup_casefold_does_not_normalize_separators():
+    with raises(th.KeyError):
+        get({"user_id": 1}, _["userId"], lookup="casefold")
+
+
+def test_lookup_normalize():
+    for key in ("userId", "user_id", "UserID", "user-id"):
+        assert get({"body": {key: 1}}, _["body"]["USER_ID"], lookup="normalize") == 1
+
+
+def test_lookup_custom_normalizer():
+    assert get({"user": 1}, _["  user  "], lookup=str.strip) == 1
+
+
+def test_lookup_non_mapping():
+    assert get([1, 2], _[1], lookup="normalize") == 2
+
+    with raises(th.IndexError):
+        get([1, 2], _[2], lookup="normalize")
+
+
+def test_lookup_nonexisting_key():
+    exception = "th.KeyError: _['body']['name']\n" \
+                "                       ^^^^^^ does not exist"
+
+    with raises(th.KeyError) as exc:
+        get({"body": {"userId": 1}}, _["body"]["name"], lookup="normalize")
+
+    assert repr(exc.value) == exception
+
+
+def test_lookup_nonexisting_key_with_default():
+    assert get({"userId": 1}, _["name"], default=s.default, lookup="casefold") == s.default
+
+
+def test_lookup_unknown_policy():
+    with raises(ValueError):
+        get({}, _["key"], lookup="unknown")
+
+
+def test_lookup_index_cached():
+    lookup = KeyLookup(str.casefold)
+    mapping = {"A": 1, "B": 2}
+
+    assert get(mapping, _["a"], lookup=lookup) == 1
+    assert get(mapping, _["b"], lookup=lookup) == 2
+
+    assert lookup.cache_info()["misses"] == 1
+    assert lookup.cache_info()["hits"] == 1
+
+
+def test_lookup_index_invalidated_on_resize():
+    lookup = KeyLookup(str.casefold)
+    mapping = {"A": 1}
+
+    assert get(mapping, _["a"], lookup=lookup) == 1
+
+    mapping["C"] = 3
+    assert get(mapping, _["c"], lookup=lookup) == 3
+
+
+def test_lookup_index_removed_key():
+    lookup = KeyLookup(str.casefold)
+    mapping = {"A": 1, "B": 2}
+    assert get(mapping, _["a"], lookup=lookup) == 1
+
+    del mapping["A"]
+    mapping["C"] = 3
+    with raises(th.KeyError):
+        get(mapping, _["a"], lookup=lookup)
+
+
+def test_lookup_index_replaced_key():
+    lookup = KeyLookup(normalize)
+    mapping = {"id": 1, "userId": 2}
+    assert get(mapping, _["user_id"], lookup=lookup) == 2
+
+    del mapping["userId"]
+    mapping["UserID"] = 3
+    assert get(mapping, _["user_id"], lookup=lookup) == 3
+
+
+def test_lookup_custom_normalizer_shared():
+    def normalizer(key):
+        return key.upper()
+
+    assert get_lookup(normalizer) is get_lookup(normalizer)
+    assert get_lookup(normalizer) is not get_lookup(str.upper)
+
+
+def test_lookup_cache_does_not_retain_mappings():
+    lookup = KeyLookup(str.casefold)
+    mapping = {"A": 1}
+    refcount = getrefcount(mapping)
+
+    assert get(mapping, _["a"], lookup=lookup) == 1
+    assert getrefcount(mapping) == refcount
+
+
+def test_lookup_missing_key_does_not_rebuild_index():
+    lookup = KeyLookup(str.casefold)
+    mapping = {f"Key{i}": i for i in range(1000)}
+
+    for _attempt in range(5):
+        with raises(th.KeyError):
+            get(mapping, _["other"], lookup=lookup)
+
+    assert lookup.cache_info()["misses"] == 1
+    assert lookup.cache_info()["hits"] == 4
@@ -0,0 +1,124 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import sentinel as s
+
+from pytest import raises
+
+import th
+from th import _, get_many
+
+
+class Resource:
+    def __init__(self, id, delay=0.0):
+        self.id = id
+        self.delay = delay
+
+    @property
+    def body(self):
+        time.sleep(self.delay)
+        return {"id": self.id}
+
+
+def test_get_many():
+    resources = [Resource(i) for i in range(5)]
+
+    assert get_many(resources, _.body["id"]) == [0, 1, 2, 3, 4]
+
+
+def test_get_many_compiled():
+    resources = [Resource(i) for i in range(5)]
+
+    assert get_many(resources, th.compile(_.body["id"])) == [0, 1, 2, 3, 4]
+
+
+def test_get_many_default():
+    assert get_many([Resource(1), None], _.body["id"], default=s.default) == [1, s.default]
+
+
+def test_get_many_error():
+    with raises(th.AttributeError) as exc:
+        get_many([Resource(1), None], _.body["id"])
+
+    assert exc.value.path == "_.body['id']"
+
+
+def test_get_many_return_exceptions():
+    results = get_many([Resource(1), None], _.body["id"], return_exceptions=True)
+
+    assert results[0] == 1
+    assert isinstance(results[1], th.AttributeError)
+
+
+def test_get_many_executor_preserves_order():
+    resources = [Resource(i, delay=(10 - i) / 1000) for i in range(10)]
+
+    with ThreadPoolExecutor(4) as executor:
+        results = get_many(resources, _.body["id"], executor=executor, max_in_flight=3)
+
+    assert results == list(range(10))
+
+
+def test_get_many_executor_concurrent():
+    resources = [Resource(i, delay=0.05) for i in range(8)]
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(8) as executor:
+        results = get_many(resources, _.body["id"], executor=executor)
+    elapsed = time.monotonic() - started
+
+    assert results == list(range(8))
+    assert elapsed < 0.05 * 8 / 2
+
+
+def test_get_many_executor_bounded():
+    lock = threading.Lock()
+    in_flight = max_in_flight = 0
+
+    class Tracked:
+        @property
+        def body(self):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.005)
+            with lock:
+                in_flight -= 1
+            return 1
+
+    with ThreadPoolExecutor(8) as executor:
+        get_many((Tracked() for _i in range(20)), _.body, executor=executor, max_in_flight=2)
+
+    assert max_in_flight <= 2
+
+
+def test_get_many_executor_error():
+    with ThreadPoolExecutor(2) as executor:
+        with raises(th.KeyError) as exc:
+            get_many([{"id": 1}, {}, {"id": 3}], _["id"], executor=executor)
+
+    assert exc.value.path == "_['id']"
+
+
+def test_get_many_executor_return_exceptions():
+    with ThreadPoolExecutor(2) as executor:
+        results = get_many([{"id": 1}, {}], _["id"], executor=executor, return_exceptions=True)
+
+    assert results[0] == 1
+    assert isinstance(results[1], th.KeyError)
+
+
+def test_get_many_invalid_max_in_flight():
+    with raises(ValueError):
+        get_many([], _.id, max_in_flight=0)
+
+
+def test_get_many_executor_shared_caches():
+    documents = [th.freeze({"userId": i, "name": str(i)}) for i in range(200)]
+    documents += [{"UserID": i} for i in range(200)]
+
+    with ThreadPoolExecutor(8) as executor:
+        results = get_many(documents, _["user_id"], lookup="normalize", executor=executor)
+
+    assert results == list(range(200)) * 2
@@ -0,0 +1,140 @@
+from sys import getrefcount
+from unittest.mock import sentinel as s
+
+from pytest import raises
+
+import th
+from th import _
+
+
+class Request:
+    headers = {"Content-Type": "application/json", "x-trace-id": s.trace_id,
+               "x-trace-span": s.span}
+
+
+def test_match_glob():
+    assert th.get(Request, _.headers[th.match("x-trace-*")]) == s.trace_id
+
+
+def test_match_regex():
+    path = _.headers[th.match(r"x-trace-(span|parent)", regex=True)]
+
+    assert th.get(Request, path) == s.span
+
+
+def test_match_all():
+    values = th.get(Request, _.headers[th.match("x-trace-*", all=True)])
+
+    assert not isinstance(values, list)
+    assert list(values) == [s.trace_id, s.span]
+
+
+def test_match_all_empty():
+    assert list(th.get(Request, _.headers[th.match("x-request-*", all=True)])) == []
+
+
+def test_match_nested():
+    obj = {"labels": {"env-prod": {"region": "eu"}}}
+
+    assert th.get(obj, _["labels"][th.match("env-*")]["region"]) == "eu"
+
+
+def test_match_non_string_keys():
+    assert th.get({1: s.one, "1": s.two}, _[th.match("1")]) == s.two
+
+
+def test_match_cached_keys():
+    headers = {"x-a": 1}
+    path = _[th.match("x-*")]
+    assert th.get(headers, path) == 1
+
+    headers["x-b"] = 2
+    del headers["x-a"]
+    headers["y"] = 3
+
+    assert th.get(headers, path) == 2
+
+
+def test_match_replaced_keys():
+    headers = {"x-a": 1, "y": 2}
+    path = _[th.match("x-*")]
+    assert th.get(headers, path) == 1
+
+    del headers["x-a"]
+    headers["x-b"] = 3
+    assert th.get(headers, path) == 3
+
+    del headers["x-b"]
+    headers["z"] = 4
+    with raises(th.KeyError):
+        th.get(headers, path)
+
+    del headers["z"]
+    headers["x-c"] = 5
+    assert th.get(headers, path) == 5
+
+
+def test_match_reused_address():
+    selector = th.match("x-trace-*", all=True)
+    first = th.match("x-*")
+    for _attempt in range(100):
+        assert list(th.get({"x-trace-a": 1, "host": "h"}, _[selector])) == [1]
+        assert list(th.get({"x-trace-a": 2, "x-trace-b": 3}, _[selector])) == [2, 3]
+
+        assert th.get({"x-b": 1, "x-a": 2}, _[first]) == 1
+        assert th.get({"x-a": 3, "x-b": 4}, _[first]) == 3
+
+
+def test_match_does_not_retain_mappings():
+    headers = {"x-a": 1}
+    refcount = getrefcount(headers)
+
+    assert th.get(headers, _[th.match("x-*")]) == 1
+    assert getrefcount(headers) == refcount
+
+
+def test_match_repr():
+    assert repr(_.headers[th.match("x-*")]) == "_.headers[th.match('x-*')]"
+    assert repr(_[th.match("x", regex=True, all=True)]) == \
+        "_[th.match('x', regex=True, all=True)]"
+
+
+def test_match_eq():
+    assert _[th.match("x-*")] == _[th.match("x-*")]
+    assert _[th.match("x-*")] != _[th.match("x-*", regex=True)]
+    assert hash(th.match("x-*")) == hash(th.match("x-*"))
+
+
+def test_match_key_error():
+    with raises(th.KeyError) as exc_info:
+        th.get(Request, _.headers[th.match("x-request-*")])
+
+    assert repr(exc_info.value) == "th.KeyError: _.headers[th.match('x-request-*')]\n" \
+                                   "                       ^^^^^^^^^^^^^^^^^^^^^^^ does not exist"
+
+
+def test_match_reused_selector_error():
+    selector = th.match("x-*")
+    with raises(th.KeyError) as exc_info:
+        th.get({"x-a": {"y": 1}}, _[selector][selector])
+
+    assert exc_info.value.index == 1
+    assert repr(exc_info.value) == "th.KeyError: _[th.match('x-*')][th.match('x-*')]\n" \
+                                   "                                ^^^^^^^^^^^^^^^ does not exist"
+
+
+def test_match_type_error():
+    with raises(th.TypeError) as exc_info:
+        th.get({"headers": None}, _["headers"][th.match("x-*")])
+
+    assert repr(exc_info.value) == "th.TypeError: _['headers'][th.match('x-*')]\n" \
+                                   "              ^^^^^^^^^^^^ inappropriate type (NoneType)"
+
+
+def test_match_default():
+    assert th.get(Request, _.headers[th.match("y-*")], default=s.default) == s.default
+
+
+def test_match_set():
+    with raises(th.TypeError):
+        th.set({"headers": {"x-a": 1}}, _["headers"][th.match("x-*")], 2)
@@ -44,3 +44,38 @@ def test_atr_accessor_str():
 def test_atr_accessor_repr():
     accessor = AttrAccessor("attr")
     assert repr(accessor) == "AttrAccessor('attr')"
+
+
+def test_item_accessor_probe():
+    assert ItemAccessor("key").probe({"key": "val"}) == (True, "val")
+    assert ItemAccessor(1).probe([1, 2]) == (True, 2)
+    assert ItemAccessor(-2).probe((1, 2)) == (True, 1)
+
+
+def test_item_accessor_probe_failure():
+    ok, error = ItemAccessor("key").probe({})
+    assert not ok and isinstance(error, KeyError)
+
+    ok, error = ItemAccessor(2).probe([1, 2])
+    assert not ok and isinstance(error, IndexError)
+
+    ok, error = ItemAccessor("key").probe([1, 2])
+    assert not ok and isinstance(error, TypeError)
+
+    ok, error = ItemAccessor([]).probe({})
+    assert not ok and isinstance(error, TypeError)
+
+
+def test_attr_accessor_probe():
+    class User:
+        name = "<name>"
+
+    assert AttrAccessor("name").probe(User) == (True, "<name>")
+
+    ok, error = AttrAccessor("email").probe(User)
+    assert not ok and isinstance(error, AttributeError)
+
+
+def test_operator_hash():
+    assert hash(ItemAccessor("key")) == hash(ItemAccessor("key"))
+    assert len({ItemAccessor("key"), ItemAccessor("key"), AttrAccessor("key")}) == 2
@@ -40,3 +40,7 @@ def test_path_holder_proxy_iter(*, proxy: PathHolderProxy):
     assert isinstance(iter(proxy), Generator)
 
     assert list(x for x in proxy) == []
+
+
+def test_path_holder_proxy_hash(*, proxy: PathHolderProxy):
+    assert hash(proxy) == hash(PathHolderProxy(PathHolder))
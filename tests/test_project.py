@@ -0,0 +1,158 @@
+import csv
+import io
+from dataclasses import dataclass
+from typing import NamedTuple, Optional
+from unittest.mock import sentinel as s
+
+from pytest import raises
+
+import th
+from th import _, project
+
+RECORDS = [
+    {"id": 1, "user": {"name": "Bob", "address": {"city": "Paris"}}, "tags": ["a"]},
+    {"id": 2, "user": {"name": "Alice", "address": {"city": "Oslo"}}, "tags": ["b"]},
+]
+
+COLUMNS = {
+    "id": _["id"],
+    "name": _["user"]["name"],
+    "city": _["user"]["address"]["city"],
+}
+
+
+class Row(NamedTuple):
+    id: int
+    name: str
+    city: str
+
+
+@dataclass
+class Record:
+    city: str
+    name: str
+    id: Optional[int] = None
+
+
+def test_project_tuples():
+    rows = project(RECORDS, COLUMNS)
+
+    assert list(rows) == [(1, "Bob", "Paris"), (2, "Alice", "Oslo")]
+
+
+def test_project_is_lazy():
+    def records():
+        yield RECORDS[0]
+        raise AssertionError("consumed too early")
+
+    assert next(project(records(), COLUMNS)) == (1, "Bob", "Paris")
+
+
+def test_project_sequence_of_paths():
+    rows = project(RECORDS, [_["id"], _["tags"][0]])
+
+    assert list(rows) == [(1, "a"), (2, "b")]
+
+
+def test_project_single_column():
+    assert list(project(RECORDS, [_["id"]])) == [(1,), (2,)]
+
+
+def test_project_root_column():
+    assert list(project([1, 2], [_])) == [(1,), (2,)]
+
+
+def test_project_namedtuple():
+    rows = list(project(RECORDS, COLUMNS, row=Row))
+
+    assert rows == [Row(1, "Bob", "Paris"), Row(2, "Alice", "Oslo")]
+
+
+def test_project_dataclass():
+    rows = list(project(RECORDS, COLUMNS, row=Record))
+
+    assert rows == [Record("Paris", "Bob", 1), Record("Oslo", "Alice", 2)]
+
+
+def test_project_dict():
+    rows = list(project(RECORDS, COLUMNS, row=dict))
+
+    assert rows[0] == {"id": 1, "name": "Bob", "city": "Paris"}
+
+
+def test_project_batches():
+    batches = list(project(RECORDS * 3, COLUMNS, batch_size=4))
+
+    assert [len(batch) for batch in batches] == [4, 2]
+
+    output = io.StringIO()
+    csv.writer(output).writerows(batches[0])
+    assert output.getvalue().splitlines()[0] == "1,Bob,Paris"
+
+
+def test_project_shared_prefix_resolved_once():
+    class Record:
+        calls = 0
+
+        @property
+        def user(self):
+            type(self).calls += 1
+            return {"name": "Bob", "age": 30}
+
+    rows = list(project([Record(), Record()], [_.user["name"], _.user["age"]]))
+
+    assert rows == [("Bob", 30), ("Bob", 30)]
+    assert Record.calls == 2
+
+
+def test_project_failure_not_resolved_again():
+    class Record:
+        calls = 0
+
+        @property
+        def body(self):
+            type(self).calls += 1
+            return {"id": 1, "user": {"name": "Bob"}}
+
+    columns = [_.body["id"], _.body["user"]["email"], _.body["user"]["name"]]
+    rows = list(project([Record()], columns, default=s.default))
+
+    assert rows == [(1, s.default, "Bob")]
+    assert Record.calls == 1
+
+    with raises(th.KeyError):
+        list(project([Record()], columns))
+    assert Record.calls == 2
+
+
+def test_project_frozen_documents():
+    rows = project([th.freeze(x) for x in RECORDS], COLUMNS)
+
+    assert list(rows) == [(1, "Bob", "Paris"), (2, "Alice", "Oslo")]
+
+
+def test_project_default():
+    records = [{"id": 1, "user": None}, {"id": 2, "user": {"name": "Alice"}}]
+    rows = project(records, COLUMNS, default=s.default)
+
+    assert list(rows) == [(1, s.default, s.default), (2, "Alice", s.default)]
+
+
+def test_project_error():
+    exception = "th.KeyError: _['user']['address']['city']\n" \
+                "                       ^^^^^^^^^ does not exist"
+
+    records = [RECORDS[0], {"id": 2, "user": {"name": "Alice"}}]
+    rows = project(records, COLUMNS)
+
+    assert next(rows) == (1, "Bob", "Paris")
+    with raises(th.KeyError) as exc:
+        next(rows)
+
+    assert repr(exc.value) == exception
+    assert exc.value.index == 1
+
+
+def test_project_invalid_batch_size():
+    with raises(ValueError):
+        project(RECORDS, COLUMNS, batch_size=0)
@@ -0,0 +1,108 @@
+from struct import pack
+
+import pytest
+from pytest import raises
+
+import th
+from th import RecordLayout, _, get
+
+
+@pytest.fixture()
+def layout() -> RecordLayout:
+    return RecordLayout([("id", "I"), ("temp", "f"), ("flag", "?")])
+
+
+@pytest.fixture()
+def buffer() -> memoryview:
+    return memoryview(b"".join(pack("<If?", i, i / 2, i % 2 == 0) for i in range(4)))
+
+
+def test_record_layout(*, layout: RecordLayout):
+    assert layout.names == ("id", "temp", "flag")
+    assert layout.itemsize == 9
+    assert layout.offset("temp") == 4
+    assert layout.offset("flag") == 8
+
+
+def test_record_layout_native_alignment():
+    layout = RecordLayout([("flag", "?"), ("id", "I")], byteorder="@")
+
+    assert layout.offset("id") == 4
+    assert layout.itemsize == 8
+
+
+def test_get_record_field(*, layout: RecordLayout, buffer: memoryview):
+    records = layout.records(buffer)
+
+    assert len(records) == 4
+    assert get(records, _[3]["id"]) == 3
+    assert get(records, _[3].temp) == 1.5
+    assert get(records, _[-1].flag) is False
+
+
+def test_get_record_column(*, layout: RecordLayout, buffer: memoryview):
+    records = layout.records(buffer)
+
+    assert list(get(records, _["id"])) == [0, 1, 2, 3]
+    assert list(get(records, _[1:3]["id"])) == [1, 2]
+    assert get(records, _["temp"][2]) == 1.0
+
+
+def test_record_buffer_zero_copy(*, layout: RecordLayout):
+    data = bytearray(pack("<If?", 1, 0.5, True))
+    records = layout.records(data)
+    data[0] = 7
+
+    assert get(records, _[0].id) == 7
+
+
+def test_get_record_nonexisting_field(*, layout: RecordLayout, buffer: memoryview):
+    records = layout.records(buffer)
+
+    with raises(th.KeyError):
+        get(records, _[0]["name"])
+    with raises(th.AttributeError):
+        get(records, _[0].name)
+
+
+def test_get_record_out_of_range(*, layout: RecordLayout, buffer: memoryview):
+    with raises(th.IndexError):
+        get(layout.records(buffer), _[4].id)
+
+
+def test_record_repr(*, layout: RecordLayout, buffer: memoryview):
+    assert repr(layout.records(buffer)[1]) == "Record(id=1, temp=0.5, flag=False)"
+
+
+def test_get_structured_array_field():
+    np = pytest.importorskip("numpy")
+    arr = np.array([(1, 0.5), (2, 1.5)], dtype=[("id", "i4"), ("temp", "f4")])
+
+    column = get(arr, _.temp)
+    assert np.shares_memory(column, arr)
+    assert column.tolist() == [0.5, 1.5]
+
+    assert np.shares_memory(get(arr, _["id"]), arr)
+    assert get(arr, _[1:].id).tolist() == [2]
+
+
+def test_get_structured_array_field_shadows_attribute():
+    np = pytest.importorskip("numpy")
+    arr = np.array([(1, 5.0, 3), (2, 7.0, 4)],
+                   dtype=[("max", "i4"), ("size", "f4"), ("T", "i4")])
+
+    assert get(arr, _.max).tolist() == [1, 2]
+    assert get(arr, _.size).tolist() == [5.0, 7.0]
+    assert get(arr, _.T).tolist() == [3, 4]
+    assert get(arr, _.shape) == (2,)
+
+    assert th.first(arr, _.max).tolist() == [1, 2]
+    assert th.compile(_.size)(arr).tolist() == [5.0, 7.0]
+
+
+def test_get_structured_array_nonexisting_field():
+    np = pytest.importorskip("numpy")
+    arr = np.array([(1,)], dtype=[("id", "i4")])
+
+    with raises(th.AttributeError):
+        get(arr, _.temp)
@@ -0,0 +1,195 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, NamedTuple
+
+from pytest import raises
+
+import th
+from th import _, freeze
+
+
+@dataclass
+class Response:
+    status: int
+    body: Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class FrozenResponse:
+    status: int
+    body: Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class FrozenRequest:
+    method: str
+    retries: int = field(default=0, init=False)
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+def test_set_mapping():
+    document = {"user": {"name": "Bob", "age": 30}, "items": [1, 2, 3]}
+    updated = th.set(document, _["user"]["name"], "Alice")
+
+    assert updated == {"user": {"name": "Alice", "age": 30}, "items": [1, 2, 3]}
+    assert document == {"user": {"name": "Bob", "age": 30}, "items": [1, 2, 3]}
+    assert updated["items"] is document["items"]
+
+
+def test_set_new_key():
+    document = {"user": {}}
+
+    assert th.set(document, _["user"]["name"], "Bob") == {"user": {"name": "Bob"}}
+    assert document == {"user": {}}
+
+
+def test_set_list():
+    document = {"items": [1, [2, 3], 4]}
+    updated = th.set(document, _["items"][1][0], 20)
+
+    assert updated == {"items": [1, [20, 3], 4]}
+    assert document == {"items": [1, [2, 3], 4]}
+
+
+def test_set_root():
+    assert th.set({"id": 1}, _, {"id": 2}) == {"id": 2}
+
+
+def test_set_attribute():
+    response = Response(200, {"users": []})
+    updated = th.set(response, _.body["users"], ["Bob"])
+
+    assert updated == Response(200, {"users": ["Bob"]})
+    assert response == Response(200, {"users": []})
+
+
+def test_set_frozen_dataclass():
+    response = FrozenResponse(200, {"users": []})
+    updated = th.set(response, _.status, 404)
+
+    assert updated == FrozenResponse(404, {"users": []})
+    assert updated.body is response.body
+
+
+def test_set_tuple():
+    assert th.set({"point": (1, 2)}, _["point"][0], 10) == {"point": (10, 2)}
+
+
+def test_set_namedtuple():
+    updated = th.set({"point": Point(1, 2)}, _["point"].y, 20)
+
+    assert updated == {"point": Point(1, 20)}
+    assert type(updated["point"]) is Point
+
+
+def test_set_frozen_document():
+    document = freeze({"user": {"name": "Bob"}, "items": [1, 2]})
+    updated = th.set(document, _["user"]["email"], "bob@example.com")
+
+    assert updated == {"user": {"name": "Bob", "email": "bob@example.com"}, "items": (1, 2)}
+    assert isinstance(updated, th.FrozenDict)
+    assert updated.table is document.table
+    assert updated["items"] is document["items"]
+
+
+def test_update_shares_untouched_subtrees():
+    document = {"a": {"x": {"deep": [1]}, "y": {"deep": [2]}}, "b": {"deep": [3]}}
+    updated = th.update(document, {_["a"]["x"]["deep"]: [10], _["a"]["z"]: 0})
+
+    assert updated == {"a": {"x": {"deep": [10]}, "y": {"deep": [2]}, "z": 0},
+                       "b": {"deep": [3]}}
+    assert updated["a"]["y"] is document["a"]["y"]
+    assert updated["b"] is document["b"]
+
+
+def test_update_shared_prefix_resolved_once():
+    class CountingDict(dict):
+        calls = 0
+
+        def __getitem__(self, key):
+            type(self).calls += 1
+            return super().__getitem__(key)
+
+    document = CountingDict(user={"name": "Bob", "age": 30})
+    updated = th.update(document, {_["user"]["name"]: "Alice", _["user"]["age"]: 31})
+
+    assert updated == {"user": {"name": "Alice", "age": 31}}
+    assert type(updated) is CountingDict
+    assert CountingDict.calls == 1
+
+
+def test_update_pairs():
+    updated = th.update({"a": 1, "b": 2}, [(_["a"], 10), (_["b"], 20), (_["a"], 100)])
+
+    assert updated == {"a": 100, "b": 20}
+
+
+def test_update_value_and_nested_path():
+    value = {"x": 1}
+    updated = th.update({"a": None}, {_["a"]: value, _["a"]["y"]: 2})
+
+    assert updated == {"a": {"x": 1, "y": 2}}
+    assert value == {"x": 1}
+
+
+def test_update_empty():
+    document = {"a": 1}
+    assert th.update(document, {}) is document
+
+
+def test_set_nonexisting_key():
+    exception = "th.KeyError: _['user']['profile']['name']\n" \
+                "                       ^^^^^^^^^ does not exist"
+
+    with raises(th.KeyError) as exc:
+        th.set({"user": {}}, _["user"]["profile"]["name"], "Bob")
+
+    assert repr(exc.value) == exception
+
+
+def test_set_out_of_range():
+    exception = "th.IndexError: _['items'][5]\n" \
+                "                          ^ out of range"
+
+    with raises(th.IndexError) as exc:
+        th.set({"items": [1]}, _["items"][5], 0)
+
+    assert repr(exc.value) == exception
+
+
+def test_set_inappropriate_type():
+    exception = "th.TypeError: _['status'][0]\n" \
+                "              ^^^^^^^^^^^ inappropriate type (str)"
+
+    with raises(th.TypeError) as exc:
+        th.set({"status": "OK"}, _["status"][0], "o")
+
+    assert repr(exc.value) == exception
+
+
+def test_set_nonexisting_attribute():
+    with raises(th.AttributeError):
+        th.set({"point": Point(1, 2)}, _["point"].z, 3)
+
+
+def test_set_frozen_dataclass_nonexisting_field():
+    exception = "th.AttributeError: _['request'].url\n" \
+                "                                ^^^ does not exist"
+
+    with raises(th.AttributeError) as exc:
+        th.set({"request": FrozenRequest("GET")}, _["request"].url, "/")
+
+    assert repr(exc.value) == exception
+
+
+def test_set_frozen_dataclass_non_init_field():
+    exception = "th.TypeError: _['request'].retries\n" \
+                "              ^^^^^^^^^^^^ inappropriate type (FrozenRequest)"
+
+    with raises(th.TypeError) as exc:
+        th.set({"request": FrozenRequest("GET")}, _["request"].retries, 3)
+
+    assert repr(exc.value) == exception
@@ -1,125 +1,88 @@
-from pprint import pformat
-from typing import Any, Union
-
-from niltype import Nil, NilType
-
-from ._error import Error
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from ._error import (  # noqa: F401
+    AttributeError,
+    Error,
+    IndexError,
+    KeyError,
+    LookupError,
+    TypeError,
+    _AttributeError,
+)
 from ._path_holder import PathHolder
 from ._path_holder_proxy import PathHolderProxy
-from ._utils import get_carets, get_indent, get_type_name
+from ._resolver import error_cache_info, get
 from ._version import version
 
-__version__ = version
-__all__ = ("get", "_", "PathHolder", "PathHolderProxy",)
-
-_AttributeError = AttributeError
-_IndexError = IndexError
-_KeyError = KeyError
-_TypeError = TypeError
-
+if TYPE_CHECKING:
+    from ._capture import FailureCapture, capture
+    from ._compiled import CompiledPath, compile  # noqa: F401
+    from ._descend import Descend, descend
+    from ._first import first
+    from ._frozen import FrozenDict, freeze
+    from ._index import PathIndex, index
+    from ._lookup import KeyLookup
+    from ._many import get_many
+    from ._match import KeyMatch, match
+    from ._project import project
+    from ._records import RecordLayout
+    from ._update import set, update  # noqa: F401
 
-class AttributeError(Error, _AttributeError):
-    """
-    Represents an AttributeError wrapped in a custom Error class.
-    """
-    pass
-
-
-class IndexError(Error, _AttributeError):
-    """
-    Represents an IndexError wrapped in a custom Error class.
-    """
-    pass
-
-
-class KeyError(Error, _KeyError):
-    """
-    Represents a KeyError wrapped in a custom Error class.
+__version__ = version
+# `set` and `compile` are left out, as they would shadow builtins on `from th import *`
+__all__ = ("get", "get_many", "first", "update", "project", "_", "PathHolder",
+           "PathHolderProxy", "CompiledPath", "KeyLookup", "freeze", "FrozenDict", "RecordLayout",
+           "error_cache_info", "index", "PathIndex", "match", "KeyMatch", "descend", "Descend",
+           "capture", "FailureCapture",)
+
+# Subsystems that are not needed by `get` are imported on first use, keeping `import th` cheap
+_lazy_attributes: Dict[str, str] = {
+    "capture": "._capture",
+    "FailureCapture": "._capture",
+    "compile": "._compiled",
+    "CompiledPath": "._compiled",
+    "descend": "._descend",
+    "Descend": "._descend",
+    "first": "._first",
+    "freeze": "._frozen",
+    "FrozenDict": "._frozen",
+    "KeyLookup": "._lookup",
+    "get_many": "._many",
+    "match": "._match",
+    "KeyMatch": "._match",
+    "index": "._index",
+    "PathIndex": "._index",
+    "project": "._project",
+    "RecordLayout": "._records",
+    "set": "._update",
+    "update": "._update",
+}
+
+
+def __getattr__(name: str) -> Any:
     """
-    pass
-
+    Import a lazily loaded attribute of the package on first access.
 
-class TypeError(Error, _TypeError):
+    :param name: The attribute name.
+    :return: The attribute value.
+    :raises AttributeError: If the package has no such attribute.
     """
-    Represents a TypeError wrapped in a custom Error class.
-    """
-    pass
+    module_name = _lazy_attributes.get(name)
+    if module_name is None:
+        raise _AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 
-def get(obj: Any, path: PathHolder, *,
-        default: Union[Any, NilType] = Nil, verbose: bool = False) -> Any:
+def __dir__() -> List[str]:
     """
-    Retrieve the value at a given path from the target object.
-
-    This function attempts to traverse the given `path` on the `obj`. If any attribute,
-    key, or index does not exist, and a `default` value is provided, the default value
-    will be returned. If no default is provided, a custom error (AttributeError, IndexError,
-    KeyError, or TypeError) is raised with additional path information.
+    List the attributes of the package, including lazily loaded ones.
 
-    :param obj: The target object from which to retrieve the value.
-    :param path: A PathHolder representing the series of accessors (attributes or items).
-    :param default: The default value to return if the path is not valid. Default is `Nil`.
-    :param verbose: If True, additional debug information will be included in the error message.
-    :return: The value retrieved from the object at the specified path.
-    :raises AttributeError: If an attribute in the path does not exist and no default is provided.
-    :raises IndexError: If an index in the path is out of range and no default is provided.
-    :raises KeyError: If a key in the path does not exist and no default is provided.
-    :raises TypeError: If an operation in the path is inappropriate for the object type and
-                       no default is provided.
+    :return: The sorted attribute names.
     """
-    ptr = obj
-    prev = path.__name__
-    for operator in path:
-        try:
-            ptr = operator(ptr)
-        except _AttributeError as suppressed:
-            if default is not Nil:
-                return default
-            indent = get_indent(AttributeError, prev)
-            carets = get_carets(operator.operand, repr=str)
-            message = f"{path}\n{indent}{carets} does not exist"
-            if verbose:
-                message += f"\nwhere _ is {type(obj)}:\n{pformat(obj)}"
-            raise AttributeError(message, suppressed) from None
-
-        except _IndexError as suppressed:
-            if default is not Nil:
-                return default
-            indent = get_indent(IndexError, prev)
-            carets = get_carets(operator.operand)
-            message = f"{path}\n{indent}{carets} out of range"
-            if verbose:
-                message += f"\nwhere _ is {type(obj)}:\n{pformat(obj)}"
-            raise IndexError(message, suppressed) from None
-
-        except _KeyError as suppressed:
-            if default is not Nil:
-                return default
-            indent = get_indent(KeyError, prev)
-            carets = get_carets(operator.operand)
-            message = f"{path}\n{indent}{carets} does not exist"
-            if verbose:
-                message += f"\nwhere _ is {type(obj)}:\n{pformat(obj)}"
-            raise KeyError(message, suppressed) from None
-
-        except _TypeError as suppressed:
-            if default is not Nil:
-                return default
-            if "object is not subscriptable" in str(suppressed):
-                indent = get_indent(TypeError)
-                carets = get_carets(prev, repr=str)
-                type_name = get_type_name(ptr)
-                message = f"{path}\n{indent}{carets} inappropriate type ({type_name})"
-            else:
-                indent = get_indent(TypeError, prev)
-                carets = get_carets(operator.operand)
-                type_name = get_type_name(operator.operand)
-                message = f"{path}\n{indent}{carets} inappropriate type ({type_name})"
-            if verbose:
-                message += f"\nwhere _ is {type(obj)}:\n{pformat(obj)}"
-            raise TypeError(message, suppressed) from None
-        prev += str(operator)
-    return ptr
+    return sorted({*globals(), *_lazy_attributes})
 
 
 _ = hold = PathHolderProxy(lambda: PathHolder("_"))
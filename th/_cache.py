@@ -0,0 +1,113 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+from weakref import ref
+
+__all__ = ("IdentityCache",)
+
+_T = TypeVar("_T")
+
+
+def _make_ref(obj: Any) -> Optional[Callable[[], Any]]:
+    """
+    Return a weak reference to `obj`, or None if the type does not support weak references.
+
+    :param obj: The object to reference.
+    :return: A weak reference, or None.
+    """
+    try:
+        return ref(obj)
+    except TypeError:
+        return None
+
+
+class IdentityCache(Generic[_T]):
+    """
+    A bounded LRU cache of values derived from objects, keyed by object identity.
+
+    The cache never keeps objects alive. Objects that support weak references are held
+    weakly, so an entry is invalidated when its object dies. Plain `dict` and `list`
+    instances cannot be weakly referenced, so for them only the derived value is kept:
+    after such an object dies, its `id()` may be reused by a new object, and the entry
+    is then matched by identity and token alone. Callers must validate values derived
+    from such objects (e.g. check that a cached key still exists) before relying on them.
+
+    Every entry also stores a validation token (usually the object's size). An entry
+    whose token no longer matches is treated as stale and rebuilt.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        """
+        Initialize the IdentityCache with a maximum number of entries.
+
+        :param maxsize: The maximum number of objects tracked at the same time.
+        """
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[int, Tuple[Optional[Callable[[], Any]], Hashable, _T]]" = \
+            OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, obj: Any, token: Hashable, build: Callable[[Any], _T]) -> _T:
+        """
+        Return the cached value for `obj`, building it with `build(obj)` if needed.
+
+        :param obj: The object the value is derived from.
+        :param token: A cheap fingerprint of `obj`; a mismatch invalidates the entry.
+        :param build: A callable that derives the value from `obj`.
+        :return: The cached or freshly built value.
+        """
+        key = id(obj)
+        with self._lock:
+            entry = self._entries.get(key)
+            if (entry is not None) and ((entry[0] is None) or (entry[0]() is obj)) and \
+               (entry[1] == token):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        value = build(obj)
+
+        with self._lock:
+            self._entries[key] = (_make_ref(obj), token, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def discard(self, obj: Any) -> None:
+        """
+        Drop the cached value for `obj`, if any.
+
+        :param obj: The object whose entry should be removed.
+        """
+        with self._lock:
+            self._entries.pop(id(obj), None)
+
+    def clear(self) -> None:
+        """
+        Remove all entries and reset the hit and miss counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        """
+        Return usage statistics of the cache.
+
+        :return: A dictionary with `hits`, `misses`, `size` and `maxsize`.
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "size": len(self._entries), "maxsize": self._maxsize}
+
+    def __len__(self) -> int:
+        """
+        Return the number of cached entries.
+
+        :return: The number of entries.
+        """
+        return len(self._entries)
@@ -0,0 +1,216 @@
+from collections import deque
+from random import random
+from reprlib import Repr
+from threading import Lock
+from time import monotonic, time
+from types import TracebackType
+from typing import Any, Deque, Dict, List, NamedTuple, Optional, Tuple, Type
+
+from ._error import Error
+from ._resolver import set_failure_hook
+from .operators import Operator
+
+__all__ = ("FailureCapture", "FailureRecord", "capture",)
+
+# The number of paths whose rate limit windows are tracked at the same time
+_MAX_TRACKED_PATHS = 1024
+
+
+class FailureRecord(NamedTuple):
+    """
+    A captured failure of a path.
+    """
+
+    time: float
+    path: str
+    step_index: int
+    step: str
+    error: str
+    type_name: str
+    snapshot: str
+
+
+class FailureCapture:
+    """
+    Records failing paths into a fixed-size ring buffer for post-mortem analysis.
+
+    Every th error (AttributeError, IndexError, KeyError and TypeError) raised while the
+    capture is active, including those collected by a failing `th.first`, is recorded with
+    a size-bounded `reprlib` snapshot of the object the failing step was applied to.
+    Failures are sampled, and the number of records per path is rate-limited. Only the
+    oldest records are dropped once the buffer is full.
+    """
+
+    def __init__(self, maxlen: int = 256, *, sample_rate: float = 1.0,
+                 rate_limit: Optional[int] = None, per_seconds: float = 60.0,
+                 snapshot_size: int = 256) -> None:
+        """
+        Initialize the FailureCapture.
+
+        :param maxlen: The number of records kept in the buffer.
+        :param sample_rate: The fraction of failures that are recorded, from 0 to 1.
+        :param rate_limit: The maximum number of records per path in every `per_seconds`
+                           window. Default is no limit.
+        :param per_seconds: The length of the rate limit window in seconds.
+        :param snapshot_size: The maximum length of a snapshot in characters.
+        :raises ValueError: If an argument is out of range.
+        """
+        if maxlen < 1:
+            raise ValueError(f"maxlen must be at least 1, got {maxlen}")
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"sample_rate must be between 0 and 1, got {sample_rate}")
+        if (rate_limit is not None) and (rate_limit < 1):
+            raise ValueError(f"rate_limit must be at least 1, got {rate_limit}")
+
+        self._records: Deque[FailureRecord] = deque(maxlen=maxlen)
+        self._sample_rate = sample_rate
+        self._rate_limit = rate_limit
+        self._per_seconds = per_seconds
+        self._snapshot_size = snapshot_size
+        self._repr = Repr()
+        self._repr.maxlevel = 3
+        self._repr.maxstring = self._repr.maxother = max(snapshot_size // 4, 16)
+
+        self._lock = Lock()
+        self._windows: Dict[str, Tuple[float, int]] = {}
+        self._failures = self._sampled_out = self._rate_limited = 0
+        self._active = False
+
+    def _allow(self, path: str) -> bool:
+        """
+        Apply the sampling rate and the rate limit of the path to a failure.
+        """
+        with self._lock:
+            self._failures += 1
+            if (self._sample_rate < 1.0) and (random() >= self._sample_rate):
+                self._sampled_out += 1
+                return False
+            if self._rate_limit is None:
+                return True
+            now = monotonic()
+            started, count = self._windows.get(path, (now, 0))
+            if now - started >= self._per_seconds:
+                started, count = now, 0
+            if count >= self._rate_limit:
+                self._rate_limited += 1
+                return False
+            if (path not in self._windows) and (len(self._windows) >= _MAX_TRACKED_PATHS):
+                self._windows.clear()
+            self._windows[path] = (started, count + 1)
+            return True
+
+    def _record(self, error: Error, operator: Operator, target: Any) -> None:
+        """
+        Record a failure, if it passes sampling and rate limiting.
+
+        :param error: The th error.
+        :param operator: The failing operator.
+        :param target: The object the operator was applied to.
+        """
+        path = error.path or ""
+        if not self._allow(path):
+            return
+        try:
+            snapshot = self._repr.repr(target)
+        except Exception as exception:
+            snapshot = f"<repr failed: {type(exception).__name__}>"
+        if len(snapshot) > self._snapshot_size:
+            snapshot = snapshot[:self._snapshot_size - 3] + "..."
+        self._records.append(FailureRecord(time(), path, error.index or 0, str(operator),
+                                           type(error).__name__, error.type_name or "",
+                                           snapshot))
+
+    def start(self) -> "FailureCapture":
+        """
+        Start capturing failures, replacing any other active capture.
+
+        :return: The FailureCapture itself.
+        """
+        previous = set_failure_hook(self._record)
+        owner = getattr(previous, "__self__", None)
+        if isinstance(owner, FailureCapture):
+            owner._active = False
+        self._active = True
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop capturing failures; the records are kept.
+        """
+        if self._active:
+            set_failure_hook(None)
+            self._active = False
+
+    @property
+    def active(self) -> bool:
+        """
+        Return whether failures are being captured.
+
+        :return: True if the capture is active.
+        """
+        return self._active
+
+    def dump(self, *, clear: bool = False) -> List[FailureRecord]:
+        """
+        Return the captured failures, oldest first.
+
+        :param clear: If True, the buffer is emptied.
+        :return: The records.
+        """
+        with self._lock:
+            records = list(self._records)
+            if clear:
+                self._records.clear()
+        return records
+
+    def info(self) -> Dict[str, int]:
+        """
+        Return statistics of the capture.
+
+        :return: A dictionary with the number of `failures` seen, failures `sampled_out` and
+                 `rate_limited`, and the `size` and `maxlen` of the buffer.
+        """
+        with self._lock:
+            return {"failures": self._failures, "sampled_out": self._sampled_out,
+                    "rate_limited": self._rate_limited, "size": len(self._records),
+                    "maxlen": self._records.maxlen or 0}
+
+    def __len__(self) -> int:
+        """
+        Return the number of captured failures in the buffer.
+
+        :return: The number of records.
+        """
+        return len(self._records)
+
+    def __enter__(self) -> "FailureCapture":
+        """
+        Start capturing failures, see `start`.
+
+        :return: The FailureCapture itself.
+        """
+        return self.start()
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        """
+        Stop capturing failures, see `stop`.
+        """
+        self.stop()
+
+
+def capture(maxlen: int = 256, *, sample_rate: float = 1.0, rate_limit: Optional[int] = None,
+            per_seconds: float = 60.0, snapshot_size: int = 256) -> FailureCapture:
+    """
+    Start capturing failing paths into a ring buffer, see `FailureCapture`.
+
+    :param maxlen: The number of records kept in the buffer.
+    :param sample_rate: The fraction of failures that are recorded, from 0 to 1.
+    :param rate_limit: The maximum number of records per path in every `per_seconds` window.
+    :param per_seconds: The length of the rate limit window in seconds.
+    :param snapshot_size: The maximum length of a snapshot in characters.
+    :return: The active FailureCapture; call `stop()` or use it as a context manager.
+    """
+    return FailureCapture(maxlen, sample_rate=sample_rate, rate_limit=rate_limit,
+                          per_seconds=per_seconds, snapshot_size=snapshot_size).start()
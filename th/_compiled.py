@@ -0,0 +1,197 @@
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+
+from niltype import Nil, NilType
+
+from ._error import _AttributeError, _IndexError, _KeyError, _TypeError
+from ._lookup import KeyLookup, get_lookup
+from ._path_holder import PathHolder
+from ._resolver import make_error, report_failure
+from .operators import AttrAccessor, ItemAccessor, Operator
+
+__all__ = ("CompiledPath", "compile",)
+
+_Errors = (_AttributeError, _IndexError, _KeyError, _TypeError)
+
+
+def _fuse(operators: Sequence[Operator]) -> Tuple[Callable[[Any], Any], ...]:
+    """
+    Turn operators into plain getters, merging runs of attribute steps into one attrgetter.
+
+    :param operators: The operators to fuse.
+    :return: The getters.
+    """
+    getters: List[Callable[[Any], Any]] = []
+    names: List[str] = []
+    for operator in operators:
+        if isinstance(operator, AttrAccessor) and ("." not in operator.operand):
+            names.append(operator.operand)
+            continue
+        if names:
+            getters.append(attrgetter(".".join(names)))
+            names = []
+        if isinstance(operator, ItemAccessor):
+            getters.append(itemgetter(operator.operand))
+        else:
+            getters.append(operator)
+    if names:
+        getters.append(attrgetter(".".join(names)))
+    return tuple(getters)
+
+
+class CompiledPath:
+    """
+    A path prepared once for repeated resolution.
+
+    Compiling snapshots the operators of a PathHolder, so later changes to the holder do
+    not affect the compiled path, and renders the path once for its representation.
+    Item steps are plain `itemgetter`s, which also serve frozen documents (see `th.freeze`).
+
+    If a schema is given, the leading steps that the schema guarantees are resolved with
+    plain getters, without tracking the failing step; if the object does not match the
+    schema after all, the path is resolved again step by step to render the error.
+    """
+
+    def __init__(self, path: PathHolder, *,
+                 lookup: Optional[Union[str, Callable[[Any], Any], KeyLookup]] = None,
+                 schema: Any = None) -> None:
+        """
+        Initialize the CompiledPath from a PathHolder.
+
+        :param path: The PathHolder to compile.
+        :param lookup: An optional key lookup policy, see `th.get`.
+        :param schema: An optional type of the target objects (a dataclass, TypedDict,
+                       named tuple or any annotated type) to check the path against.
+        :raises AttributeError: If the schema does not allow an attribute of the path.
+        :raises IndexError: If the schema does not allow an index of the path.
+        :raises KeyError: If the schema does not allow a key of the path.
+        :raises TypeError: If the schema does not allow an item access of the path.
+        """
+        self._name: str = path.__name__
+        self._operators: Tuple[Operator, ...] = tuple(path)
+        self._lookup = get_lookup(lookup) if (lookup is not None) else None
+
+        self._text = self._name + "".join(str(x) for x in self._operators)
+
+        steps = []
+        for operator in self._operators:
+            if (self._lookup is not None) and isinstance(operator, ItemAccessor):
+                steps.append(self._bind_lookup(self._lookup, operator.operand))
+            elif isinstance(operator, ItemAccessor):
+                steps.append(itemgetter(operator.operand))
+            else:
+                steps.append(operator)
+        self._steps: Tuple[Callable[[Any], Any], ...] = tuple(steps)
+        self._plan = tuple(enumerate(self._steps))
+
+        self._guaranteed = 0
+        if schema is not None:
+            from ._schema import check_path
+            self._guaranteed = check_path(self._name, self._operators, schema,
+                                          lookup=(self._lookup is not None))
+        self._direct = _fuse(self._operators[:self._guaranteed])
+        self._rest = self._plan[self._guaranteed:]
+
+    @staticmethod
+    def _bind_lookup(lookup: KeyLookup, key: Any) -> Callable[[Any], Any]:
+        """
+        Bind a key lookup to a fixed key.
+
+        :param lookup: The KeyLookup to apply.
+        :param key: The requested key.
+        :return: A callable that retrieves `key` from its argument through `lookup`.
+        """
+        return lambda target: lookup(target, key)
+
+    @property
+    def guaranteed(self) -> int:
+        """
+        Return the number of leading steps that must succeed according to the schema.
+
+        :return: The number of steps, 0 if the path was compiled without a schema.
+        """
+        return self._guaranteed
+
+    @property
+    def path(self) -> PathHolder:
+        """
+        Return a PathHolder equivalent to the compiled path.
+
+        :return: A new PathHolder holding the compiled operators.
+        """
+        return PathHolder(self._name, list(self._operators))
+
+    def __call__(self, obj: Any, *, default: Union[Any, NilType] = Nil,
+                 verbose: bool = False, lightweight: bool = False) -> Any:
+        """
+        Retrieve the value at the compiled path from the target object.
+
+        :param obj: The target object from which to retrieve the value.
+        :param default: The default value to return if the path is not valid. Default is `Nil`.
+        :param verbose: If True, additional debug information will be included in the
+                        error message.
+        :param lightweight: If True, the raised error keeps no references to the original
+                            exception or the objects, see `th.get`.
+        :return: The value retrieved from the object at the compiled path.
+        :raises AttributeError: If an attribute in the path does not exist.
+        :raises IndexError: If an index in the path is out of range.
+        :raises KeyError: If a key in the path does not exist.
+        :raises TypeError: If an operation in the path is inappropriate for the object type.
+        """
+        ptr = obj
+        plan = self._plan
+        if self._direct:
+            try:
+                for getter in self._direct:
+                    ptr = getter(ptr)
+                plan = self._rest
+            except _Errors:
+                ptr = obj
+        for index, step in plan:
+            try:
+                ptr = step(ptr)
+            except _Errors as suppressed:
+                if default is not Nil:
+                    return default
+                error = make_error(suppressed, self._name, self._operators, ptr, obj,
+                                   index=index, verbose=verbose, lightweight=lightweight)
+                report_failure(error, self._operators[index], ptr)
+                if not lightweight:
+                    raise error from None
+                break
+        else:
+            return ptr
+        obj = ptr = None
+        raise error
+
+    def __repr__(self) -> str:
+        """
+        Return a formal string representation of the CompiledPath.
+
+        :return: A string that includes the class name and the path.
+        """
+        return f"{self.__class__.__name__}({self._text})"
+
+    def __len__(self) -> int:
+        """
+        Return the number of operators in the compiled path.
+
+        :return: The length of the path.
+        """
+        return len(self._operators)
+
+
+def compile(path: PathHolder, *,
+            lookup: Optional[Union[str, Callable[[Any], Any], KeyLookup]] = None,
+            schema: Any = None) -> CompiledPath:
+    """
+    Compile a path for repeated resolution.
+
+    :param path: A PathHolder representing the series of accessors.
+    :param lookup: An optional key lookup policy, see `th.get`.
+    :param schema: An optional type of the target objects to check the path against,
+                   see `CompiledPath`.
+    :return: A CompiledPath that can be called with target objects.
+    :raises Error: If the schema does not allow the path.
+    """
+    return CompiledPath(path, lookup=lookup, schema=schema)
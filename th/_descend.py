@@ -0,0 +1,124 @@
+from collections.abc import Mapping
+from typing import Any, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from ._error import _TypeError
+from .operators import Operator
+
+__all__ = ("Descend", "Descent", "descend",)
+
+_CONTAINERS: Tuple[type, ...] = (Mapping, list, tuple)
+
+
+class Descent(NamedTuple):
+    """
+    A recursive descent, as written in a path: `th.descend("id")`.
+    """
+
+    name: Any
+    max_depth: Optional[int] = None
+    types: Tuple[type, ...] = _CONTAINERS
+    keys: Optional[FrozenSet[Any]] = None
+
+    def __repr__(self) -> str:
+        """
+        Return the descent as it is written in a path.
+
+        :return: A string such as "th.descend('id', max_depth=3)".
+        """
+        options = ""
+        if self.max_depth is not None:
+            options += f", max_depth={self.max_depth}"
+        if self.types != _CONTAINERS:
+            names = ", ".join(x.__name__ for x in self.types)
+            options += f", types=({names}{',' if len(self.types) == 1 else ''})"
+        if self.keys is not None:
+            options += f", keys={sorted(self.keys, key=repr)!r}"
+        return f"th.descend({self.name!r}{options})"
+
+
+def _entries(value: Any) -> Iterator[Tuple[Any, Any]]:
+    """
+    Iterate over the entries of a container: mapping items, sequence items by index,
+    or the attributes of any other object.
+
+    :param value: The container.
+    :return: An iterator over `(key, item)` pairs.
+    """
+    if isinstance(value, Mapping):
+        return iter(value.items())
+    if isinstance(value, (list, tuple)):
+        return enumerate(value)
+    return iter(getattr(value, "__dict__", {}).items())
+
+
+class Descend(Operator):
+    """
+    Finds the values of a key (or attribute) at any depth below the target.
+
+    The target is walked depth-first, in document order, without recursion, so deep
+    documents do not hit the recursion limit. The walk is lazy: each match is found when
+    it is requested. Every container is visited once, which also protects from cycles.
+    Scalars are never descended into.
+    """
+
+    def __call__(self, target: Any) -> Any:
+        """
+        Start the descent below the target.
+
+        :param target: The object to search.
+        :return: A lazy iterator over the values of the key, in depth-first order.
+        :raises TypeError: If the target is not one of the types to descend into.
+        """
+        if not isinstance(target, self._operand.types):
+            raise _TypeError(f"{type(target).__name__!r} object is not subscriptable")
+        return self._walk(target)
+
+    def _walk(self, root: Any) -> Iterator[Any]:
+        name, max_depth, types, keys = self._operand
+        seen = {id(root)}
+        stack: List[Iterator[Tuple[Any, Any]]] = [_entries(root)]
+        while stack:
+            depth = len(stack)
+            for key, value in stack[-1]:
+                if key == name:
+                    yield value
+                if ((max_depth is not None) and (depth >= max_depth)) or \
+                   ((keys is not None) and (key not in keys)) or \
+                   (not isinstance(value, types)) or isinstance(value, (str, bytes)):
+                    continue
+                if id(value) not in seen:
+                    seen.add(id(value))
+                    stack.append(_entries(value))
+                    break
+            else:
+                stack.pop()
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the descent.
+
+        :return: A string such as "[th.descend('id')]".
+        """
+        return f"[{self._operand!r}]"
+
+
+def descend(name: Any, *, max_depth: Optional[int] = None,
+            types: Optional[Iterable[type]] = None,
+            keys: Optional[Iterable[Any]] = None) -> Descend:
+    """
+    Create a recursive descent for a path, e.g. `_.body[th.descend("id")]`, which resolves
+    to a lazy iterator over the values of every `id` key anywhere under `body`.
+
+    :param name: The key (or attribute name) to find.
+    :param max_depth: The maximum depth of the matches below the target; 1 finds only the
+                      entries of the target itself. Default is no limit.
+    :param types: The types to descend into. Default is mappings, lists and tuples; pass
+                  other classes to descend into the attributes of their instances.
+    :param keys: If given, only the entries with these keys (or indexes) are descended into.
+    :return: The descent, to be used as a key in a path.
+    :raises ValueError: If `max_depth` is less than 1.
+    """
+    if (max_depth is not None) and (max_depth < 1):
+        raise ValueError(f"max_depth must be at least 1, got {max_depth}")
+    return Descend(Descent(name, max_depth, tuple(types) if (types is not None) else _CONTAINERS,
+                           frozenset(keys) if (keys is not None) else None))
@@ -1,4 +1,6 @@
-__all__ = ("Error",)
+from typing import Any, List, Optional, Sequence, Tuple
+
+__all__ = ("Error", "AttributeError", "IndexError", "KeyError", "TypeError", "LookupError",)
 
 
 class Error(Exception):
@@ -10,15 +12,24 @@ class Error(Exception):
     re-raising exceptions while retaining the original error.
     """
 
-    def __init__(self, message: str, suppressed: Exception):
+    def __init__(self, message: str, suppressed: Optional[Exception], *,
+                 path: Optional[str] = None, index: Optional[int] = None,
+                 type_name: Optional[str] = None):
         """
         Initialize the Error instance with a message and a suppressed exception.
 
         :param message: The error message describing the exception.
-        :param suppressed: The original exception that is being suppressed.
+        :param suppressed: The original exception that is being suppressed, or None if it
+                           was dropped (see the `lightweight` option of `th.get`).
+        :param path: The string representation of the path that failed.
+        :param index: The index of the failing operator within the path.
+        :param type_name: The type name of the object the failing operator was applied to.
         """
         self.message = message
         self.suppressed = suppressed
+        self.path = path
+        self.index = index
+        self.type_name = type_name
 
     def __str__(self) -> str:
         """
@@ -35,3 +46,65 @@ class Error(Exception):
         :return: A string that includes the module, class name, and message.
         """
         return f"{self.__class__.__module__}.{self.__class__.__name__}: {self.message}"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        Support pickling, e.g. when errors are sent to other processes.
+
+        :return: The reduce tuple.
+        """
+        return self.__class__.__new__, (self.__class__,), self.__dict__
+
+
+_AttributeError = AttributeError
+_IndexError = IndexError
+_KeyError = KeyError
+_TypeError = TypeError
+_LookupError = LookupError
+
+
+class AttributeError(Error, _AttributeError):
+    """
+    Represents an AttributeError wrapped in a custom Error class.
+    """
+    __module__ = "th"
+
+
+class IndexError(Error, _AttributeError):
+    """
+    Represents an IndexError wrapped in a custom Error class.
+    """
+    __module__ = "th"
+
+
+class KeyError(Error, _KeyError):
+    """
+    Represents a KeyError wrapped in a custom Error class.
+    """
+    __module__ = "th"
+
+
+class TypeError(Error, _TypeError):
+    """
+    Represents a TypeError wrapped in a custom Error class.
+    """
+    __module__ = "th"
+
+
+class LookupError(Error, _LookupError):
+    """
+    Represents a failure of every candidate path, e.g. in `th.first`.
+
+    The individual failures are available in the `errors` attribute.
+    """
+    __module__ = "th"
+
+    def __init__(self, message: str, errors: Sequence[Error]):
+        """
+        Initialize the LookupError instance with a message and the failures of each candidate.
+
+        :param message: The error message describing the exception.
+        :param errors: The errors of the candidate paths, in order.
+        """
+        super().__init__(message, None)
+        self.errors: List[Error] = list(errors)
@@ -0,0 +1,82 @@
+from textwrap import indent
+from typing import Any, List, Optional, Tuple, Union
+
+from niltype import Nil, NilType
+
+from ._error import Error, LookupError
+from ._path_holder import PathHolder
+from ._resolver import format_obj, make_error, report_failure
+from ._trie import TrieNode
+from .operators import Operator
+
+__all__ = ("first",)
+
+
+class _Node(TrieNode):
+    """
+    A node of the prefix trie built from the candidate paths.
+
+    Each node memoizes the outcome of applying its operator to the value of its parent,
+    so a prefix shared by several candidates is resolved at most once.
+    """
+
+    __slots__ = ("resolved", "ok", "result", "target",)
+
+    def __init__(self, operator: Optional[Operator] = None) -> None:
+        super().__init__(operator)
+        self.resolved = False
+        self.ok = False
+        self.result: Any = None
+        self.target: Any = None
+
+
+def first(obj: Any, *paths: PathHolder,
+          default: Union[Any, NilType] = Nil, verbose: bool = False) -> Any:
+    """
+    Retrieve the value at the first of the given paths that exists in the target object.
+
+    Candidates are tried in order. Prefixes shared by several candidates are resolved
+    only once, and missing keys, indexes and attributes of common containers are detected
+    without raising exceptions.
+
+    :param obj: The target object from which to retrieve the value.
+    :param paths: The candidate paths, in order of preference.
+    :param default: The default value to return if none of the paths exist. Default is `Nil`.
+    :param verbose: If True, additional debug information will be included in the error message.
+    :return: The value at the first existing path.
+    :raises LookupError: If none of the paths exist and no default is provided; the error
+                         lists every candidate and where it failed.
+    """
+    root = _Node()
+    root.resolved, root.ok, root.result = True, True, obj
+
+    # Errors are rendered only once every candidate has failed
+    failures: List[Tuple[PathHolder, int, _Node]] = []
+    for path in paths:
+        node = root
+        for index, operator in enumerate(path):
+            parent, node = node, node.child(operator)
+            if not node.resolved:
+                node.ok, node.result = operator.probe(parent.result)
+                node.target = parent.result
+                node.resolved = True
+            if not node.ok:
+                if default is Nil:
+                    failures.append((path, index, node))
+                break
+        else:
+            return node.result
+
+    if default is not Nil:
+        return default
+
+    errors: List[Error] = []
+    for path, index, node in failures:
+        operators = tuple(path)
+        error = make_error(node.result, path.__name__, operators, node.target, obj, index=index)
+        report_failure(error, operators[index], node.target)
+        errors.append(error)
+    message = "none of the paths exist\n" + "\n".join(indent(repr(x), "  ") for x in errors)
+    if verbose:
+        message += f"\nwhere _ is {type(obj)}:\n{format_obj(obj)}"
+    raise LookupError(message, errors)
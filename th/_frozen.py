@@ -0,0 +1,185 @@
+from typing import Any, Dict, Hashable, Iterator, Mapping, Tuple
+from weakref import WeakValueDictionary
+
+__all__ = ("KeyTable", "FrozenDict", "freeze",)
+
+
+class KeyTable:
+    """
+    An immutable `key -> offset` table shared by all frozen dicts with the same keys.
+
+    Tables are interned by their key sequence, so thousands of frozen documents with
+    the same shape reference a single table instead of carrying their own hash table.
+    Keys that are equal but differ in type or representation (`1`, `1.0` and `True`)
+    never share a table.
+    """
+
+    __slots__ = ("keys", "offsets", "__weakref__",)
+
+    _interned: "WeakValueDictionary[Tuple[Any, ...], KeyTable]" = WeakValueDictionary()
+
+    def __init__(self, keys: Tuple[Hashable, ...]) -> None:
+        """
+        Initialize the KeyTable with a sequence of keys.
+
+        :param keys: The keys in iteration order.
+        """
+        self.keys = keys
+        self.offsets: Dict[Hashable, int] = {key: offset for offset, key in enumerate(keys)}
+
+    @classmethod
+    def intern(cls, keys: Tuple[Hashable, ...]) -> "KeyTable":
+        """
+        Return the shared table for a sequence of keys, creating it if needed.
+
+        :param keys: The keys in iteration order.
+        :return: The shared KeyTable.
+        """
+        key = tuple([x if (type(x) is str) else (type(x), repr(x), x) for x in keys])
+        table = cls._interned.get(key)
+        if table is None:
+            table = cls._interned.setdefault(key, cls(keys))
+        return table
+
+    def __repr__(self) -> str:
+        """
+        Return a formal string representation of the KeyTable.
+
+        :return: A string that includes the class name and keys.
+        """
+        return f"{self.__class__.__name__}({self.keys!r})"
+
+
+class FrozenDict(Mapping[Hashable, Any]):
+    """
+    A compact immutable mapping backed by a shared KeyTable and a tuple of values.
+    """
+
+    __slots__ = ("_table", "_values",)
+
+    def __init__(self, table: KeyTable, values: Tuple[Any, ...]) -> None:
+        """
+        Initialize the FrozenDict with a key table and the values in table order.
+
+        :param table: The shared KeyTable.
+        :param values: The values, one per key of the table.
+        """
+        self._table = table
+        self._values = values
+
+    @property
+    def table(self) -> KeyTable:
+        """
+        Return the shared key table.
+
+        :return: The KeyTable of this mapping.
+        """
+        return self._table
+
+    def __getitem__(self, key: Hashable) -> Any:
+        """
+        Retrieve the value for a key.
+
+        :param key: The key to look up.
+        :return: The value of the key.
+        :raises KeyError: If the key does not exist.
+        """
+        return self._values[self._table.offsets[key]]
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """
+        Iterate over the keys in their original order.
+
+        :return: An iterator over the keys.
+        """
+        return iter(self._table.keys)
+
+    def __len__(self) -> int:
+        """
+        Return the number of keys.
+
+        :return: The number of keys.
+        """
+        return len(self._values)
+
+    def __contains__(self, key: Any) -> bool:
+        """
+        Check whether a key exists.
+
+        :param key: The key to check.
+        :return: True if the key exists.
+        """
+        return key in self._table.offsets
+
+    def replace(self, changes: Mapping[Hashable, Any]) -> "FrozenDict":
+        """
+        Return a new FrozenDict with some values replaced or added.
+
+        The key table is shared with the original unless new keys are added.
+
+        :param changes: The keys and their new values.
+        :return: The new FrozenDict.
+        """
+        table = self._table
+        values = list(self._values)
+        keys = list(table.keys)
+        for key, value in changes.items():
+            offset = table.offsets.get(key)
+            if offset is None:
+                keys.append(key)
+                values.append(value)
+            else:
+                values[offset] = value
+        if len(keys) != len(table.keys):
+            table = KeyTable.intern(tuple(keys))
+        return FrozenDict(table, tuple(values))
+
+    def __repr__(self) -> str:
+        """
+        Return a formal string representation of the FrozenDict.
+
+        :return: A string that includes the class name and items.
+        """
+        return f"{self.__class__.__name__}({dict(self)!r})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        Support pickling and copying by re-interning the key table.
+
+        :return: The reduce tuple.
+        """
+        return _restore, (self._table.keys, self._values)
+
+
+def _restore(keys: Tuple[Hashable, ...], values: Tuple[Any, ...]) -> FrozenDict:
+    """
+    Recreate a FrozenDict from its keys and values.
+
+    :param keys: The keys in iteration order.
+    :param values: The values in key order.
+    :return: The FrozenDict.
+    """
+    return FrozenDict(KeyTable.intern(keys), values)
+
+
+def freeze(obj: Any) -> Any:
+    """
+    Convert a nested structure into a compact immutable form.
+
+    Mappings become FrozenDicts that share key tables with every other frozen mapping
+    with the same keys, lists and plain tuples become tuples, and sets become frozensets.
+    Other objects are kept as is.
+
+    :param obj: The structure to freeze, e.g. a parsed JSON document.
+    :return: The frozen structure.
+    """
+    if isinstance(obj, FrozenDict):
+        return obj
+    if isinstance(obj, Mapping):
+        table = KeyTable.intern(tuple(obj.keys()))
+        return FrozenDict(table, tuple(freeze(value) for value in obj.values()))
+    if isinstance(obj, list) or (type(obj) is tuple):
+        return tuple(freeze(value) for value in obj)
+    if isinstance(obj, (set, frozenset)):
+        return frozenset(freeze(value) for value in obj)
+    return obj
@@ -0,0 +1,309 @@
+from collections.abc import Mapping
+from sys import getsizeof
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from niltype import Nil, NilType
+
+from ._error import _AttributeError, _IndexError, _KeyError, _TypeError
+from ._path_holder import PathHolder
+from ._resolver import make_error, report_failure
+from .operators import ItemAccessor, Operator
+
+__all__ = ("PathIndex", "index",)
+
+_Errors = (_AttributeError, _IndexError, _KeyError, _TypeError)
+
+_Key = Tuple[Any, ...]
+
+_missing = object()
+
+# The number of recently used PathHolders whose index keys are remembered
+_KEYS_SIZE = 1024
+
+
+def _part(name: Any) -> Any:
+    """
+    Build one part of an index key from a document key or an item operand.
+
+    Strings and ints are kept as is; other values are paired with their type, so keys that
+    are equal but of different types (`1`, `1.0` and `True`) never share an entry.
+
+    :param name: The key or operand.
+    :return: The part of the index key.
+    """
+    return name if (type(name) is str) or (type(name) is int) else (type(name), name)
+
+
+def _key(operators: Tuple[Operator, ...]) -> _Key:
+    """
+    Build the index key of a path from the operands of its item accessors.
+
+    Other operators are kept as `(class, operand)` pairs, which never match an indexed key,
+    so such paths are resolved directly.
+
+    :param operators: The operators of the path.
+    :return: The key.
+    """
+    return tuple([_part(x.operand) if (type(x) is ItemAccessor) else (type(x), x.operand)
+                  for x in operators])
+
+
+def _operand(part: Any) -> Any:
+    """
+    Recover the document key from a part of an index key, see `_part`.
+    """
+    return part if (type(part) is str) or (type(part) is int) else part[1]
+
+
+def _children(value: Any) -> Iterator[Tuple[Any, Any]]:
+    """
+    Iterate over the items of a container: mapping keys, or list and tuple indexes.
+
+    :param value: The container (any other value has no items).
+    :return: An iterator over `(key, item)` pairs.
+    """
+    if isinstance(value, Mapping):
+        return iter(value.items())
+    if isinstance(value, (list, tuple)):
+        return enumerate(value)
+    return iter(())
+
+
+class PathIndex:
+    """
+    A flat index of a static document, mapping paths to values.
+
+    Containers are flattened level by level, on first access below them, so a document is
+    never flattened beyond the parts that are queried (or `max_depth`). Once a path is
+    indexed, resolving it is a single dict lookup. The keys of recently used PathHolders
+    are remembered by identity, so reusing a PathHolder does not rebuild its key.
+    The document must not be modified while it is indexed.
+    """
+
+    def __init__(self, doc: Any, *, max_depth: Optional[int] = None,
+                 reverse: bool = False) -> None:
+        """
+        Initialize the PathIndex over a document.
+
+        :param doc: The document: nested mappings, lists and tuples.
+        :param max_depth: The maximum length of indexed paths. Longer paths are resolved
+                          from their deepest indexed prefix. Default is no limit.
+        :param reverse: If True, `find` can look up the paths of a value.
+        :raises ValueError: If `max_depth` is negative.
+        """
+        if (max_depth is not None) and (max_depth < 0):
+            raise ValueError(f"max_depth must be non-negative, got {max_depth}")
+        self._doc = doc
+        self._max_depth = max_depth
+        self._values: Dict[_Key, Any] = {}
+        self._expanded: Set[_Key] = set()
+        self._keys_nbytes = 0
+        self._reverse: Optional[Dict[Tuple[type, Any], List[_Key]]] = None
+        self._reverse_enabled = reverse
+        self._keys: Dict[int, Tuple[PathHolder, int, _Key]] = {}
+
+    def _expand(self, key: _Key, value: Any) -> None:
+        """
+        Index the items of the container at the given key.
+
+        :param key: The key of the container.
+        :param value: The container; other values are not indexed.
+        """
+        if not isinstance(value, (Mapping, list, tuple)):
+            return
+        for name, item in _children(value):
+            child = key + (_part(name),)
+            self._values[child] = item
+            self._keys_nbytes += getsizeof(child)
+        self._expanded.add(key)
+
+    def _can_expand(self, key: _Key) -> bool:
+        return (key not in self._expanded) and \
+               ((self._max_depth is None) or (len(key) < self._max_depth))
+
+    def get(self, path: PathHolder, *, default: Union[Any, NilType] = Nil,
+            verbose: bool = False) -> Any:
+        """
+        Retrieve the value at a given path from the indexed document.
+
+        :param path: A PathHolder representing the series of accessors.
+        :param default: The default value to return if the path is not valid. Default is `Nil`.
+        :param verbose: If True, additional debug information will be included in the
+                        error message.
+        :return: The value at the path.
+        :raises AttributeError: If an attribute in the path does not exist.
+        :raises IndexError: If an index in the path is out of range.
+        :raises KeyError: If a key in the path does not exist.
+        :raises TypeError: If an operation in the path is inappropriate for the object type.
+        """
+        entry = self._keys.get(id(path))
+        if (entry is not None) and (entry[0] is path) and (entry[1] == len(path)):
+            key = entry[2]
+        else:
+            key = _key(tuple(path))
+            if len(self._keys) >= _KEYS_SIZE:
+                self._keys.clear()
+            # The holder is kept alive by the entry, so its id is not reused
+            self._keys[id(path)] = (path, len(path), key)
+        try:
+            return self._values[key]
+        except _KeyError:
+            pass
+        except _TypeError:  # unhashable operands, e.g. slices
+            key = ()
+        return self._resolve(path.__name__, tuple(path), key, default, verbose)
+
+    def _resolve(self, name: str, operators: Tuple[Operator, ...], key: _Key,
+                 default: Union[Any, NilType], verbose: bool) -> Any:
+        """
+        Resolve a path that is not indexed yet, indexing the containers along it.
+
+        Steps below the indexed part of the document are applied directly.
+        """
+        value = self._doc
+        indexed = bool(key)
+        for index, operator in enumerate(operators):
+            if indexed:
+                prefix = key[:index]
+                if self._can_expand(prefix):
+                    self._expand(prefix, value)
+                item = self._values.get(prefix + (key[index],), _missing)
+                if item is not _missing:
+                    value = item
+                    continue
+                indexed = False
+            try:
+                value = operator(value)
+            except _Errors as suppressed:
+                if default is not Nil:
+                    return default
+                error = make_error(suppressed, name, operators, value, self._doc,
+                                   index=index, verbose=verbose)
+                report_failure(error, operator, value)
+                raise error from None
+        return value
+
+    def __getitem__(self, path: PathHolder) -> Any:
+        """
+        Retrieve the value at a given path, see `get`.
+
+        :param path: A PathHolder representing the series of accessors.
+        :return: The value at the path.
+        """
+        return self.get(path)
+
+    def __contains__(self, path: PathHolder) -> bool:
+        """
+        Check whether a path exists in the indexed document.
+
+        :param path: A PathHolder representing the series of accessors.
+        :return: True if the path can be resolved.
+        """
+        return self.get(path, default=_missing) is not _missing
+
+    def build(self) -> "PathIndex":
+        """
+        Index the whole document up to `max_depth` at once.
+
+        :return: The PathIndex itself.
+        """
+        for _entry in self._walk():
+            pass
+        return self
+
+    def _walk(self) -> Iterator[Tuple[_Key, Any]]:
+        """
+        Index the whole document up to `max_depth`, yielding every entry in document order.
+        """
+        stack: List[Tuple[_Key, Any]] = [((), self._doc)]
+        while stack:
+            key, value = stack.pop()
+            if key:
+                yield key, value
+            if self._can_expand(key):
+                self._expand(key, value)
+            elif key not in self._expanded:
+                continue
+            children = [(key + (_part(name),), item) for name, item in _children(value)]
+            stack.extend(reversed(children))
+
+    def find(self, value: Any) -> List[PathHolder]:
+        """
+        Find the paths of a scalar value in the document, in document order.
+
+        The reverse index is built on the first call, indexing the whole document.
+        Containers (mappings, lists and tuples) are not indexed by value.
+
+        :param value: The value to look up.
+        :return: The paths at which the value occurs (compared by type and equality).
+        :raises ValueError: If the index was created without `reverse=True`.
+        """
+        if not self._reverse_enabled:
+            raise ValueError("reverse index is disabled, use th.index(doc, reverse=True)")
+        if self._reverse is None:
+            reverse: Dict[Tuple[type, Any], List[_Key]] = {}
+            for key, item in self._walk():
+                if isinstance(item, (Mapping, list, tuple)):
+                    continue
+                try:
+                    reverse.setdefault((type(item), item), []).append(key)
+                except _TypeError:  # unhashable values are not indexed
+                    pass
+            self._reverse = reverse
+        try:
+            keys = self._reverse.get((type(value), value), [])
+        except _TypeError:
+            return []
+        return [PathHolder("_", [ItemAccessor(_operand(x)) for x in key]) for key in keys]
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Return the approximate memory used by the index, excluding the document itself.
+
+        :return: The size of the index tables and keys in bytes.
+        """
+        nbytes = getsizeof(self._values) + getsizeof(self._expanded) + self._keys_nbytes
+        nbytes += getsizeof(self._keys)
+        if self._reverse is not None:
+            nbytes += getsizeof(self._reverse)
+            nbytes += sum(getsizeof(x) for x in self._reverse.values())
+        return nbytes
+
+    def info(self) -> Dict[str, int]:
+        """
+        Return statistics of the index.
+
+        :return: A dictionary with the number of indexed `entries`, `expanded` containers
+                 and the approximate size of the index in bytes (`nbytes`).
+        """
+        return {"entries": len(self._values), "expanded": len(self._expanded),
+                "nbytes": self.nbytes}
+
+    def __len__(self) -> int:
+        """
+        Return the number of paths indexed so far.
+
+        :return: The number of entries.
+        """
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        """
+        Return a formal string representation of the PathIndex.
+
+        :return: A string that includes the class name and the number of entries.
+        """
+        return f"{self.__class__.__name__}(entries={len(self._values)})"
+
+
+def index(doc: Any, *, max_depth: Optional[int] = None, reverse: bool = False) -> PathIndex:
+    """
+    Index a static document for fast repeated lookups.
+
+    :param doc: The document: nested mappings, lists and tuples.
+    :param max_depth: The maximum length of indexed paths. Default is no limit.
+    :param reverse: If True, the index can also look up the paths of a value (`find`).
+    :return: A PathIndex over the document.
+    """
+    return PathIndex(doc, max_depth=max_depth, reverse=reverse)
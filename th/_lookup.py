@@ -0,0 +1,182 @@
+from functools import lru_cache
+from typing import Any, Callable, Dict, Mapping, Union
+
+from ._cache import IdentityCache
+
+__all__ = ("KeyLookup", "get_lookup", "casefold", "normalize",)
+
+
+def casefold(key: Any) -> Any:
+    """
+    Normalize a string key for case-insensitive comparison.
+
+    :param key: The key to normalize.
+    :return: The casefolded key, or the key itself if it is not a string.
+    """
+    return key.casefold() if isinstance(key, str) else key
+
+
+def normalize(key: Any) -> Any:
+    """
+    Normalize a string key so that snake_case, camelCase, kebab-case and PascalCase
+    spellings of the same name compare equal (`userId`, `user_id`, `UserID`).
+
+    :param key: The key to normalize.
+    :return: The normalized key, or the key itself if it is not a string.
+    """
+    if not isinstance(key, str):
+        return key
+    return key.replace("_", "").replace("-", "").casefold()
+
+
+class KeyLookup:
+    """
+    Resolves mapping keys through a normalizing function.
+
+    An exact match is always tried first. Otherwise the requested key is normalized and
+    looked up in an index of `normalized key -> actual key` built once per mapping and
+    kept in an identity cache, so repeated lookups on the same mapping stay O(1).
+    The cache holds only the indexes, never the mappings themselves.
+
+    The index is invalidated when the size or the first key of the mapping changes, and
+    rebuilt when the key it resolves to no longer exists (e.g. after keys were replaced
+    in place). A key that is missing from the index is not looked up again, so call
+    `clear()` after adding keys in place without changing the size.
+    """
+
+    def __init__(self, normalizer: Callable[[Any], Any], *, maxsize: int = 128) -> None:
+        """
+        Initialize the KeyLookup with a key normalizer.
+
+        :param normalizer: A callable mapping a key to its normalized form.
+        :param maxsize: The maximum number of mappings whose indexes are cached.
+        """
+        self._normalizer = normalizer
+        self._cache: IdentityCache[Dict[Any, Any]] = IdentityCache(maxsize)
+
+    @property
+    def normalizer(self) -> Callable[[Any], Any]:
+        """
+        Return the key normalizer of this lookup.
+
+        :return: The normalizer callable.
+        """
+        return self._normalizer
+
+    def _build_index(self, mapping: Mapping[Any, Any]) -> Dict[Any, Any]:
+        """
+        Build the `normalized key -> actual key` index for a mapping.
+
+        When several keys normalize to the same value, the first one wins.
+
+        :param mapping: The mapping to index.
+        :return: The index.
+        """
+        index: Dict[Any, Any] = {}
+        for key in mapping:
+            index.setdefault(self._normalizer(key), key)
+        return index
+
+    def find(self, mapping: Mapping[Any, Any], key: Any) -> Any:
+        """
+        Find the actual key of `mapping` that corresponds to `key`.
+
+        :param mapping: The mapping to search.
+        :param key: The requested key.
+        :return: The actual key.
+        :raises KeyError: If no key of the mapping normalizes to the same value.
+        """
+        if key in mapping:
+            return key
+        normalized = self._normalizer(key)
+        token = (len(mapping), next(iter(mapping), _missing))
+        index = self._cache.get_or_build(mapping, token, self._build_index)
+        actual = index.get(normalized, _missing)
+        if (actual is not _missing) and (actual not in mapping):
+            # The key was replaced in place, so the index is stale
+            self._cache.discard(mapping)
+            index = self._cache.get_or_build(mapping, token, self._build_index)
+            actual = index.get(normalized, _missing)
+        if actual is _missing:
+            raise KeyError(key)
+        return actual
+
+    def __call__(self, target: Any, key: Any) -> Any:
+        """
+        Retrieve the item of `target` that corresponds to `key`.
+
+        Targets that are not mappings are subscripted directly.
+
+        :param target: The object to subscript.
+        :param key: The requested key.
+        :return: The value of the item.
+        :raises KeyError: If the key does not exist in the target.
+        """
+        if not isinstance(target, Mapping):
+            return target[key]
+        return target[self.find(target, key)]
+
+    def clear(self) -> None:
+        """
+        Drop all cached indexes.
+        """
+        self._cache.clear()
+
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Return usage statistics of the index cache.
+
+        :return: A dictionary with `hits`, `misses`, `size` and `maxsize`.
+        """
+        return self._cache.info()
+
+    def __repr__(self) -> str:
+        """
+        Return a formal string representation of the KeyLookup.
+
+        :return: A string that includes the class name and normalizer.
+        """
+        return f"{self.__class__.__name__}({self._normalizer!r})"
+
+
+_missing = object()
+
+_lookups: Dict[str, KeyLookup] = {
+    "casefold": KeyLookup(casefold),
+    "normalize": KeyLookup(normalize),
+}
+
+
+@lru_cache(maxsize=32)
+def _custom_lookup(normalizer: Callable[[Any], Any]) -> KeyLookup:
+    """
+    Return a KeyLookup for a custom normalizer; recently used ones are shared.
+
+    :param normalizer: The key normalizer.
+    :return: The KeyLookup.
+    """
+    return KeyLookup(normalizer)
+
+
+def get_lookup(lookup: Union[str, Callable[[Any], Any], KeyLookup]) -> KeyLookup:
+    """
+    Resolve a lookup policy to a shared KeyLookup instance.
+
+    :param lookup: A policy name ("casefold" or "normalize"), a key normalizer,
+                   or a KeyLookup instance.
+    :return: The KeyLookup for the policy; instances are shared so that their
+             index caches are reused across calls. Only the KeyLookups of the most
+             recently used custom normalizers are shared.
+    :raises ValueError: If the policy name is unknown.
+    """
+    if isinstance(lookup, KeyLookup):
+        return lookup
+    if isinstance(lookup, str):
+        try:
+            return _lookups[lookup]
+        except KeyError:
+            raise ValueError(f"Unknown lookup policy {lookup!r}") from None
+    try:
+        return _custom_lookup(lookup)
+    except TypeError:  # unhashable normalizers are not shared
+        return KeyLookup(lookup)
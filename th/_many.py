@@ -0,0 +1,88 @@
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Deque, Iterable, List, Optional, Union
+
+from niltype import Nil, NilType
+
+from ._compiled import CompiledPath
+from ._error import Error
+from ._lookup import KeyLookup
+from ._path_holder import PathHolder
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+
+__all__ = ("get_many",)
+
+
+def _resolve(path: CompiledPath, obj: Any, default: Union[Any, NilType], verbose: bool,
+             lightweight: bool, return_exceptions: bool) -> Any:
+    """
+    Resolve a compiled path against one object, optionally returning the error.
+
+    :param path: The compiled path.
+    :param obj: The target object.
+    :param default: The default value to return if the path is not valid.
+    :param verbose: If True, additional debug information will be included in the error message.
+    :param lightweight: If True, the error keeps no references to the object, see `th.get`.
+    :param return_exceptions: If True, the th error is returned instead of being raised.
+    :return: The resolved value, or the th error if `return_exceptions` is True.
+    """
+    try:
+        return path(obj, default=default, verbose=verbose, lightweight=lightweight)
+    except Error as error:
+        if return_exceptions:
+            return error
+        raise
+
+
+def get_many(objs: Iterable[Any], path: Union[PathHolder, CompiledPath], *,
+             default: Union[Any, NilType] = Nil, verbose: bool = False,
+             lookup: Optional[Union[str, Callable[[Any], Any], KeyLookup]] = None,
+             lightweight: bool = False, return_exceptions: bool = False,
+             executor: Optional["Executor"] = None, max_in_flight: int = 32) -> List[Any]:
+    """
+    Retrieve the value at a given path from each of the target objects.
+
+    The path is compiled once, so it is safe to use even if the holder is modified
+    concurrently. With an `executor` (e.g. a ThreadPoolExecutor), objects are resolved
+    concurrently, which helps when the path goes through properties that block on I/O.
+    At most `max_in_flight` objects are submitted at a time, and results are returned in
+    the order of the objects.
+
+    :param objs: The target objects.
+    :param path: A PathHolder or a CompiledPath.
+    :param default: The default value to use for objects where the path is not valid.
+    :param verbose: If True, additional debug information will be included in error messages.
+    :param lookup: An optional key lookup policy, see `th.get`. Ignored for compiled paths.
+    :param lightweight: If True, errors keep no references to the objects, see `th.get`.
+    :param return_exceptions: If True, th errors are returned in place of the values instead
+                              of being raised.
+    :param executor: An optional executor to resolve the objects concurrently.
+    :param max_in_flight: The maximum number of objects submitted to the executor at a time.
+    :return: The values, in the order of the objects.
+    :raises Error: The error of the first failing object (in order), unless a default is
+                   provided or `return_exceptions` is True. Pending work is cancelled.
+    :raises ValueError: If `max_in_flight` is less than 1.
+    """
+    if max_in_flight < 1:
+        raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+    if not isinstance(path, CompiledPath):
+        path = CompiledPath(path, lookup=lookup)
+    options = (default, verbose, lightweight, return_exceptions)
+
+    if executor is None:
+        return [_resolve(path, obj, *options) for obj in objs]
+
+    results: List[Any] = []
+    pending: Deque["Future[Any]"] = deque()
+    try:
+        for obj in objs:
+            if len(pending) >= max_in_flight:
+                results.append(pending.popleft().result())
+            pending.append(executor.submit(_resolve, path, obj, *options))
+        while pending:
+            results.append(pending.popleft().result())
+    finally:
+        for future in pending:
+            future.cancel()
+    return results
@@ -0,0 +1,142 @@
+import re
+from fnmatch import translate
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Mapping, NamedTuple, Pattern, Tuple
+
+from ._cache import IdentityCache
+from ._error import _KeyError, _TypeError
+from .operators import Operator
+
+__all__ = ("KeyMatch", "KeyPattern", "match",)
+
+
+class KeyPattern(NamedTuple):
+    """
+    A key pattern, as written in a path: `th.match("x-trace-*")`.
+    """
+
+    pattern: str
+    regex: bool = False
+    all: bool = False
+
+    def __repr__(self) -> str:
+        """
+        Return the pattern as it is written in a path.
+
+        :return: A string such as "th.match('x-trace-*', regex=True)".
+        """
+        options = "".join(f", {name}=True" for name in ("regex", "all") if getattr(self, name))
+        return f"th.match({self.pattern!r}{options})"
+
+
+@lru_cache(maxsize=256)
+def _compile(pattern: str, regex: bool) -> Pattern[str]:
+    """
+    Compile a glob or regular expression pattern; compiled patterns are shared process-wide.
+
+    :param pattern: The pattern.
+    :param regex: True for a regular expression, False for a glob pattern (`*`, `?`, `[...]`).
+    :return: The compiled pattern.
+    """
+    return re.compile(pattern if regex else translate(pattern))
+
+
+# Matched keys per mapping (keyed by identity and validated by the keys of the mapping),
+# and per pattern within a mapping; the mappings themselves are not retained
+_matches: IdentityCache[Dict[KeyPattern, Tuple[Any, ...]]] = IdentityCache(128)
+
+
+class KeyMatch(Operator):
+    """
+    Selects the items of a mapping whose keys match a pattern.
+
+    String keys are matched with `fullmatch` against a glob pattern (as in `fnmatch`) or
+    a regular expression. The matched keys are cached per mapping, keyed by its identity
+    and validated against its current keys, in order. Checking the keys is much cheaper
+    than matching them, and it keeps the cache correct for mappings that are modified in
+    place or that reuse the address of a freed mapping (plain dicts are not weakly
+    referenced by the cache).
+    """
+
+    def __init__(self, pattern: KeyPattern) -> None:
+        """
+        Initialize the KeyMatch with a key pattern.
+
+        :param pattern: The key pattern.
+        """
+        super().__init__(pattern)
+        self._compiled = _compile(pattern.pattern, pattern.regex)
+
+    def _scan(self, target: Mapping[Any, Any]) -> Tuple[Any, ...]:
+        """
+        Find the keys of the mapping that match the pattern, in iteration order.
+        """
+        fullmatch = self._compiled.fullmatch
+        return tuple(key for key in target if isinstance(key, str) and fullmatch(key))
+
+    def __call__(self, target: Any) -> Any:
+        """
+        Retrieve the value of the first matching key, or the values of all matching keys.
+
+        :param target: The mapping.
+        :return: The value of the first matching key, or a lazy iterator over the values of
+                 all matching keys if the pattern was created with `all=True`.
+        :raises KeyError: If no key matches (unless `all=True`).
+        :raises TypeError: If the target is not a mapping.
+        """
+        if not isinstance(target, Mapping):
+            raise _TypeError(f"{type(target).__name__!r} object is not subscriptable")
+        matches = _matches.get_or_build(target, tuple(target), lambda _target: {})
+        keys = matches.get(self._operand)
+        if keys is None:
+            keys = matches[self._operand] = self._scan(target)
+        if self._operand.all:
+            return self._iter_values(target, keys)
+        if not keys:
+            raise _KeyError(self._operand.pattern)
+        return target[keys[0]]
+
+    @staticmethod
+    def _iter_values(target: Mapping[Any, Any], keys: Tuple[Any, ...]) -> Iterator[Any]:
+        for key in keys:
+            yield target[key]
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Compare two KeyMatch instances by their patterns.
+
+        :param other: The other object to compare.
+        :return: True if both select keys with the same pattern.
+        """
+        return isinstance(other, KeyMatch) and (self._operand == other._operand)
+
+    def __hash__(self) -> int:
+        """
+        Return a hash of the operator based on its pattern.
+
+        :return: The hash value.
+        """
+        return hash((KeyMatch, self._operand))
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the selection.
+
+        :return: A string such as "[th.match('x-trace-*')]".
+        """
+        return f"[{self._operand!r}]"
+
+
+def match(pattern: str, *, regex: bool = False, all: bool = False) -> KeyMatch:
+    """
+    Create a key selector for a path, e.g. `_.headers[th.match("x-trace-*")]`.
+
+    :param pattern: A glob pattern (`*`, `?`, `[...]`), or a regular expression if `regex`
+                    is True. The whole key must match.
+    :param regex: If True, the pattern is a regular expression.
+    :param all: If True, the selector resolves to a lazy iterator over the values of all
+                matching keys (possibly empty) instead of the value of the first one.
+    :return: The selector, to be used as a key in a path.
+    :raises re.error: If the regular expression is not valid.
+    """
+    return KeyMatch(KeyPattern(pattern, regex, all))
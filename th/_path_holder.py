@@ -1,5 +1,5 @@
 from copy import deepcopy
-from typing import Any, Dict, Generator, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from niltype import Nil, Nilable
 
@@ -27,14 +27,13 @@ class PathHolder:
         self.__name = self.__name__ = name
         self.__path: List[Operator] = path if (path is not Nil) else []
 
-    def __iter__(self) -> Generator[Operator, None, None]:
+    def __iter__(self) -> Iterator[Operator]:
         """
-        Yield each operator in the path.
+        Iterate over the operators in the path.
 
-        :return: A generator that yields operators in the path.
+        :return: An iterator over the operators in the path.
         """
-        for operator in self.__path:
-            yield operator
+        return iter(self.__path)
 
     def __getattr__(self, name: str) -> "PathHolder":
         """
@@ -50,10 +49,12 @@ class PathHolder:
         """
         Add an item accessor to the path and return the updated PathHolder.
 
-        :param key: The key or index to be accessed.
+        Operators, such as key selectors (`th.match`), are added to the path as they are.
+
+        :param key: The key or index to be accessed, or an operator.
         :return: A new PathHolder with the item accessor added to the path.
         """
-        self.__path.append(ItemAccessor(key))
+        self.__path.append(key if isinstance(key, Operator) else ItemAccessor(key))
         return self
 
     def __repr__(self) -> str:
@@ -73,6 +74,18 @@ class PathHolder:
         """
         return isinstance(self, other.__class__) and (self.__dict__ == other.__dict__)
 
+    def __hash__(self) -> int:
+        """
+        Return a hash of the PathHolder based on its name and operators.
+
+        This allows paths to be used as dictionary keys (e.g. in `th.update`). As the
+        holder is mutable, it must not be extended while it is used as a key.
+
+        :return: The hash value.
+        :raises TypeError: If an operand is not hashable.
+        """
+        return hash((self.__name, tuple(self.__path)))
+
     def __copy__(self) -> "PathHolder":
         """
         Create a shallow copy of the PathHolder.
@@ -66,6 +66,14 @@ class PathHolderProxy:
         """
         return isinstance(self, other.__class__) and (self.__dict__ == other.__dict__)
 
+    def __hash__(self) -> int:
+        """
+        Return a hash of the PathHolderProxy based on its factory.
+
+        :return: The hash value.
+        """
+        return hash(self.__factory)
+
     def __copy__(self) -> "PathHolderProxy":
         """
         Create a shallow copy of the PathHolderProxy.
@@ -0,0 +1,217 @@
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from niltype import Nil, NilType
+
+from ._error import _AttributeError, _IndexError, _KeyError, _TypeError
+from ._path_holder import PathHolder
+from ._trie import LabeledTrieNode
+from .operators import ItemAccessor, Operator
+
+__all__ = ("project",)
+
+_Errors = (_AttributeError, _IndexError, _KeyError, _TypeError)
+
+_failed = object()
+
+
+class _Node(LabeledTrieNode):
+    """
+    A node of the trie of column paths, holding the register its value is stored in.
+    """
+
+    __slots__ = ("slot",)
+
+    def __init__(self, operator: Optional[Operator] = None) -> None:
+        super().__init__(operator)
+        self.slot = 0
+
+
+_Step = Tuple[int, Callable[[Any], Any], int, _Node]
+
+
+def _plan(root: _Node) -> List[_Step]:
+    """
+    Flatten the trie into steps `(source register, operator, target register, node)`.
+
+    Every node is evaluated exactly once per record, so shared prefixes are resolved once.
+
+    :param root: The root of the trie.
+    :return: The steps in evaluation order.
+    """
+    steps: List[_Step] = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        for child in reversed(node.children):
+            child.slot = len(steps) + 1
+            operator = child.operator
+            if isinstance(operator, ItemAccessor):
+                operator = itemgetter(operator.operand)
+            steps.append((node.slot, operator, child.slot, child))
+            stack.append(child)
+    return steps
+
+
+def _row_builder(row: Callable[..., Any], names: Optional[Sequence[str]]
+                 ) -> Callable[[Sequence[Any]], Any]:
+    """
+    Choose how rows are built from a sequence of column values.
+
+    :param row: The row type: tuple, list, dict, a named tuple, a dataclass or any callable
+                accepting the columns as keyword arguments.
+    :param names: The column names, or None if the columns are positional.
+    :return: A callable building a row from the column values.
+    """
+    if row in (tuple, list):
+        return row
+    if names is None:
+        return lambda values: row(*values)
+    if row is dict:
+        return lambda values: dict(zip(names, values))
+    if tuple(getattr(row, "_fields", ())) == tuple(names):
+        return getattr(row, "_make")  # type: ignore
+    return lambda values: row(**dict(zip(names, values)))
+
+
+def _batched(rows: Iterator[Any], batch_size: int) -> Iterator[List[Any]]:
+    """
+    Group rows into lists of at most `batch_size` rows.
+
+    :param rows: The rows.
+    :param batch_size: The maximum size of a batch.
+    :return: An iterator over the batches.
+    """
+    batch: List[Any] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def project(records: Iterable[Any],
+            columns: Union[Mapping[str, PathHolder], Sequence[PathHolder]], *,
+            row: Callable[..., Any] = tuple, batch_size: Optional[int] = None,
+            default: Union[Any, NilType] = Nil) -> Iterator[Any]:
+    """
+    Lazily project records into flat rows, one value per column path.
+
+    All column paths are combined into a single evaluation plan, in which prefixes shared
+    by several columns are resolved once per record.
+
+    :param records: The records to project.
+    :param columns: A mapping of column names to paths, or a sequence of paths.
+    :param row: The row type: tuple (default), list, dict, a named tuple, a dataclass, or any
+                callable accepting the columns as keyword arguments (or positional arguments
+                if `columns` is a sequence).
+    :param batch_size: If given, rows are yielded in lists of at most this many rows,
+                       e.g. for `csv.writer.writerows` or `executemany`.
+    :param default: The value to use for columns whose path is not valid. Default is `Nil`.
+    :return: An iterator over the rows (or batches of rows).
+    :raises AttributeError: If an attribute in a path does not exist and no default is provided.
+    :raises IndexError: If an index in a path is out of range and no default is provided.
+    :raises KeyError: If a key in a path does not exist and no default is provided.
+    :raises TypeError: If an operation in a path is inappropriate for the object type and
+                       no default is provided.
+    :raises ValueError: If `batch_size` is less than 1.
+    """
+    if (batch_size is not None) and (batch_size < 1):
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+    names: Optional[Sequence[str]] = None
+    if isinstance(columns, Mapping):
+        names, paths = list(columns.keys()), list(columns.values())
+    else:
+        paths = list(columns)
+
+    root = _Node()
+    leaves = [root.insert(path) for path in paths]
+    steps = _plan(root)
+    slots = [leaf.slot for leaf in leaves]
+    build = _row_builder(row, names)
+
+    rows = _project(records, steps, slots, build, default)
+    return rows if (batch_size is None) else _batched(rows, batch_size)
+
+
+def _project(records: Iterable[Any], steps: List[_Step], slots: List[int],
+             build: Callable[[Sequence[Any]], Any], default: Union[Any, NilType]
+             ) -> Iterator[Any]:
+    """
+    Evaluate the plan for each record and build the rows.
+
+    :param records: The records to project.
+    :param steps: The evaluation plan, see `_plan`.
+    :param slots: The registers holding the column values, in column order.
+    :param build: A callable building a row from the column values.
+    :param default: The value to use for columns whose path is not valid, or `Nil`.
+    :return: An iterator over the rows.
+    :raises Error: The th error of the first failing step, if no default is provided.
+    """
+    plan = [(source, operator, target) for source, operator, target, _node in steps]
+    if len(slots) == 1:
+        slot = slots[0]
+        gather: Callable[[List[Any]], Sequence[Any]] = lambda registers: (registers[slot],)
+    elif slots:
+        gather = itemgetter(*slots)
+    else:
+        gather = lambda registers: ()  # noqa: E731
+
+    registers: List[Any] = [None] * (len(steps) + 1)
+    for record in records:
+        registers[0] = record
+        try:
+            for source, operator, target in plan:
+                registers[target] = operator(registers[source])
+        except _Errors as suppressed:
+            # The register of step i is i + 1, so `target` identifies the failing step
+            _resolve_slow(registers, steps, target - 1, suppressed, default)
+            if default is not Nil:
+                yield build([default if (x is _failed) else x for x in gather(registers)])
+                continue
+        yield build(gather(registers))
+
+
+def _resolve_slow(registers: List[Any], steps: List[_Step], failed: int,
+                  suppressed: Exception, default: Union[Any, NilType]) -> None:
+    """
+    Finish evaluating a record after a step failed.
+
+    Without a default, the th error of the failing step is raised. Otherwise the register
+    of the failing step, and of every step below it, is marked as failed, and the other
+    remaining steps are evaluated. The steps before the failing one are not evaluated again.
+
+    :param registers: The registers of the record, filled up to the failing step.
+    :param steps: The evaluation plan, see `_plan`.
+    :param failed: The index of the failing step.
+    :param suppressed: The original exception raised by the failing step.
+    :param default: The value to use for columns whose path is not valid, or `Nil`.
+    :raises Error: The th error of the failing step, if no default is provided.
+    """
+    source, _operator, target, node = steps[failed]
+    if default is Nil:
+        raise node.fail(suppressed, registers[source]) from None
+    registers[target] = _failed
+    for source, operator, target, node in steps[failed + 1:]:
+        value = registers[source]
+        if value is _failed:
+            registers[target] = _failed
+            continue
+        try:
+            registers[target] = operator(value)
+        except _Errors:
+            registers[target] = _failed
@@ -0,0 +1,275 @@
+from struct import Struct
+from typing import Any, Dict, Iterator, Sequence, Tuple, Union, overload
+
+__all__ = ("RecordLayout", "RecordBuffer", "RecordColumn", "Record",)
+
+
+class RecordLayout:
+    """
+    Describes the layout of packed binary records in terms of `struct` formats.
+
+    Each field is resolved to a byte offset and a single-field Struct once, so reading a
+    field of a record is a single `unpack_from` call on the underlying buffer.
+    """
+
+    def __init__(self, fields: Sequence[Tuple[str, str]], *, byteorder: str = "<") -> None:
+        """
+        Initialize the RecordLayout with field names and formats.
+
+        :param fields: A sequence of `(name, format)` pairs, e.g. `[("id", "I"), ("temp", "f")]`.
+        :param byteorder: The `struct` byte order prefix applied to every field, default is "<".
+        """
+        self._byteorder = byteorder
+        self._fields: Dict[str, Tuple[int, Struct]] = {}
+        prefix = byteorder
+        for name, fmt in fields:
+            struct = Struct(byteorder + fmt)
+            # For native alignment, the offset includes the padding inserted before the field
+            offset = Struct(prefix + fmt).size - struct.size
+            self._fields[name] = (offset, struct)
+            prefix += fmt
+        self._struct = Struct(prefix)
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """
+        Return the field names in layout order.
+
+        :return: A tuple of field names.
+        """
+        return tuple(self._fields)
+
+    @property
+    def itemsize(self) -> int:
+        """
+        Return the size of a single record in bytes.
+
+        :return: The record size.
+        """
+        return self._struct.size
+
+    def offset(self, name: str) -> int:
+        """
+        Return the byte offset of a field within a record.
+
+        :param name: The field name.
+        :return: The offset of the field.
+        :raises KeyError: If the field does not exist.
+        """
+        return self._fields[name][0]
+
+    def unpack_field(self, buffer: Any, base: int, name: str) -> Any:
+        """
+        Read a single field of the record starting at `base`.
+
+        :param buffer: The buffer holding the records.
+        :param base: The byte offset of the record.
+        :param name: The field name.
+        :return: The value of the field.
+        :raises KeyError: If the field does not exist.
+        """
+        offset, struct = self._fields[name]
+        return struct.unpack_from(buffer, base + offset)[0]
+
+    def records(self, buffer: Any) -> "RecordBuffer":
+        """
+        Wrap a buffer of packed records without copying it.
+
+        :param buffer: A bytes-like object, e.g. a `memoryview`.
+        :return: A RecordBuffer over the buffer.
+        """
+        return RecordBuffer(self, memoryview(buffer).cast("B"))
+
+    def __repr__(self) -> str:
+        """
+        Return a formal string representation of the RecordLayout.
+
+        :return: A string that includes the class name and the record format.
+        """
+        return f"{self.__class__.__name__}({self._struct.format!r}, names={self.names!r})"
+
+
+class Record:
+    """
+    A zero-copy view of a single packed record; fields are read on access.
+    """
+
+    __slots__ = ("_layout", "_buffer", "_base",)
+
+    def __init__(self, layout: RecordLayout, buffer: memoryview, base: int) -> None:
+        """
+        Initialize the Record view.
+
+        :param layout: The layout of the record.
+        :param buffer: The buffer holding the record.
+        :param base: The byte offset of the record within the buffer.
+        """
+        self._layout = layout
+        self._buffer = buffer
+        self._base = base
+
+    def __getitem__(self, name: str) -> Any:
+        """
+        Read a field of the record.
+
+        :param name: The field name.
+        :return: The value of the field.
+        :raises KeyError: If the field does not exist.
+        """
+        return self._layout.unpack_field(self._buffer, self._base, name)
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Read a field of the record.
+
+        :param name: The field name.
+        :return: The value of the field.
+        :raises AttributeError: If the field does not exist.
+        """
+        if not name.startswith("_"):
+            try:
+                return self._layout.unpack_field(self._buffer, self._base, name)
+            except KeyError:
+                pass
+        raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {name!r}")
+
+    def __repr__(self) -> str:
+        """
+        Return a formal string representation of the Record.
+
+        :return: A string that includes the class name and the field values.
+        """
+        fields = ", ".join(f"{name}={self[name]!r}" for name in self._layout.names)
+        return f"{self.__class__.__name__}({fields})"
+
+
+class RecordBuffer(Sequence[Record]):
+    """
+    A zero-copy sequence of packed records.
+
+    Integer indexes return Record views, slices return RecordBuffers over a slice of
+    the same memory, and field names return a lazy column of that field.
+    """
+
+    def __init__(self, layout: RecordLayout, buffer: memoryview) -> None:
+        """
+        Initialize the RecordBuffer.
+
+        :param layout: The layout of the records.
+        :param buffer: A byte-format memoryview holding the records.
+        """
+        self._layout = layout
+        self._buffer = buffer
+        self._size = len(buffer) // layout.itemsize
+
+    @overload
+    def __getitem__(self, index: int) -> Record: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "RecordBuffer": ...
+
+    @overload
+    def __getitem__(self, index: str) -> "RecordColumn": ...
+
+    def __getitem__(self, index: Union[int, slice, str]
+                    ) -> Union[Record, "RecordBuffer", "RecordColumn"]:
+        """
+        Retrieve a record, a slice of records or a column.
+
+        :param index: A record index, a slice, or a field name.
+        :return: A Record, a RecordBuffer or a RecordColumn.
+        :raises IndexError: If the record index is out of range.
+        :raises KeyError: If the field does not exist.
+        """
+        if isinstance(index, str):
+            self._layout.offset(index)
+            return RecordColumn(self, index)
+        itemsize = self._layout.itemsize
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._size)
+            if step != 1:
+                raise ValueError("RecordBuffer slices do not support steps")
+            stop = max(start, stop)
+            return RecordBuffer(self._layout, self._buffer[start * itemsize:stop * itemsize])
+        if index < 0:
+            index += self._size
+        if not (0 <= index < self._size):
+            raise IndexError("record index out of range")
+        return Record(self._layout, self._buffer, index * itemsize)
+
+    def __len__(self) -> int:
+        """
+        Return the number of records.
+
+        :return: The number of records.
+        """
+        return self._size
+
+    def __repr__(self) -> str:
+        """
+        Return a formal string representation of the RecordBuffer.
+
+        :return: A string that includes the class name, layout and size.
+        """
+        return f"{self.__class__.__name__}({self._layout!r}, size={self._size})"
+
+
+class RecordColumn(Sequence[Any]):
+    """
+    A lazy view of one field across all records of a RecordBuffer.
+    """
+
+    def __init__(self, records: RecordBuffer, name: str) -> None:
+        """
+        Initialize the RecordColumn.
+
+        :param records: The records to read from.
+        :param name: The field name.
+        """
+        self._records = records
+        self._name = name
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "RecordColumn": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """
+        Read the field of a record, or a slice of the column.
+
+        :param index: A record index or a slice.
+        :return: The value of the field, or a RecordColumn for slices.
+        :raises IndexError: If the record index is out of range.
+        """
+        if isinstance(index, slice):
+            return RecordColumn(self._records[index], self._name)
+        return self._records[index][self._name]
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterate over the field values of all records.
+
+        :return: An iterator over the values.
+        """
+        layout, buffer = self._records._layout, self._records._buffer
+        offset, struct = layout._fields[self._name]
+        for base in range(offset, len(self._records) * layout.itemsize, layout.itemsize):
+            yield struct.unpack_from(buffer, base)[0]
+
+    def __len__(self) -> int:
+        """
+        Return the number of records.
+
+        :return: The number of records.
+        """
+        return len(self._records)
+
+    def __repr__(self) -> str:
+        """
+        Return a formal string representation of the RecordColumn.
+
+        :return: A string that includes the class name and field name.
+        """
+        return f"{self.__class__.__name__}({self._name!r}, size={len(self)})"
@@ -0,0 +1,248 @@
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Type, Union
+
+from niltype import Nil, NilType
+
+from ._error import (
+    AttributeError,
+    Error,
+    IndexError,
+    KeyError,
+    TypeError,
+    _AttributeError,
+    _IndexError,
+    _KeyError,
+    _TypeError,
+)
+from ._path_holder import PathHolder
+from ._utils import get_carets, get_indent, get_type_name
+from .operators import ItemAccessor, Operator
+
+if TYPE_CHECKING:
+    from ._lookup import KeyLookup
+
+__all__ = ("get", "make_error", "format_obj", "error_cache_info",
+           "set_failure_hook", "report_failure",)
+
+
+_MESSAGE_CACHE_SIZE = 1024
+
+# Called with every error raised for a failing path, see `th.capture`
+_failure_hook: Optional[Callable[[Error, Operator, Any], None]] = None
+
+
+def set_failure_hook(hook: Optional[Callable[[Error, Operator, Any], None]]
+                     ) -> Optional[Callable[[Error, Operator, Any], None]]:
+    """
+    Install a callable that is called with every error raised for a failing path.
+
+    The hook is called with the error, the failing operator and the object it was applied
+    to. It only runs when an error is raised, so resolving paths costs nothing extra.
+
+    :param hook: The hook, or None to remove it.
+    :return: The previously installed hook, if any.
+    """
+    global _failure_hook
+    previous, _failure_hook = _failure_hook, hook
+    return previous
+
+
+class _Site:
+    """
+    The operators of a failing path, as a key of the message cache.
+
+    Operators compare equal by value, so `[1]`, `[1.0]` and `[True]` (or `[0.0]` and
+    `[-0.0]`) would share a cache entry; the key is therefore the rendered text of every
+    step, which determines the message. Unhashable operands (e.g. lists) are fine as well.
+    """
+
+    __slots__ = ("operators", "_key",)
+
+    def __init__(self, operators: Tuple[Operator, ...]) -> None:
+        self.operators = operators
+        self._key = tuple([(type(x), str(x)) for x in operators])
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _Site) and (self._key == other._key)
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+
+@lru_cache(maxsize=_MESSAGE_CACHE_SIZE)
+def _render_message(kind: str, name: str, site: _Site, index: int,
+                    type_name: str) -> Tuple[str, str]:
+    """
+    Render the caret message of a failure.
+
+    Failures at the same site are rendered the same way, so the messages are memoized,
+    keyed by the path, the failing index, the kind of failure and the type name.
+
+    :param kind: The kind of failure: "attribute", "index", "key", "container" (the object
+                 does not support item access) or "operand" (the key has an inappropriate type).
+    :param name: The name of the path root, e.g. "_".
+    :param site: The operators of the path.
+    :param index: The index of the failing operator.
+    :param type_name: The type name shown in TypeError messages.
+    :return: The message and the string representation of the path.
+    """
+    operators = site.operators
+    prev = name + "".join(str(x) for x in operators[:index])
+    path = prev + "".join(str(x) for x in operators[index:])
+    operand = operators[index].operand
+
+    if kind == "attribute":
+        indent = get_indent(AttributeError, prev)
+        return f"{path}\n{indent}{get_carets(operand, repr=str)} does not exist", path
+    if kind == "index":
+        indent = get_indent(IndexError, prev)
+        return f"{path}\n{indent}{get_carets(operand)} out of range", path
+    if kind == "key":
+        indent = get_indent(KeyError, prev)
+        return f"{path}\n{indent}{get_carets(operand)} does not exist", path
+    if kind == "container":
+        indent, carets = get_indent(TypeError), get_carets(prev, repr=str)
+    else:
+        indent, carets = get_indent(TypeError, prev), get_carets(operand)
+    return f"{path}\n{indent}{carets} inappropriate type ({type_name})", path
+
+
+def report_failure(error: Error, operator: Operator, target: Any) -> None:
+    """
+    Pass an error that is about to be raised to the failure hook, if one is installed.
+
+    :param error: The th error.
+    :param operator: The failing operator.
+    :param target: The object the operator was applied to.
+    """
+    if _failure_hook is not None:
+        _failure_hook(error, operator, target)
+
+
+def error_cache_info() -> Dict[str, int]:
+    """
+    Return usage statistics of the cache of rendered error messages.
+
+    :return: A dictionary with `hits`, `misses`, `size` and `maxsize`.
+    """
+    info = _render_message.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize,
+            "maxsize": _MESSAGE_CACHE_SIZE}
+
+
+def make_error(suppressed: Exception, name: str, operators: Tuple[Operator, ...],
+               ptr: Any, obj: Any, *, index: int, verbose: bool = False,
+               lightweight: bool = False) -> Error:
+    """
+    Build a th error describing where the resolution of a path failed.
+
+    :param suppressed: The original exception raised by the operator.
+    :param name: The name of the path root, e.g. "_".
+    :param operators: The operators of the path.
+    :param ptr: The object the failing operator was applied to.
+    :param obj: The root object the path was resolved against.
+    :param index: The index of the failing operator within the path.
+    :param verbose: If True, the root object is included in the error message.
+    :param lightweight: If True, the error keeps no reference to the suppressed exception,
+                        and the verbose representation of the root object is size-bounded.
+    :return: An AttributeError, IndexError, KeyError or TypeError with a caret message.
+    """
+    error: Type[Error]
+    type_name = ""
+    if isinstance(suppressed, _AttributeError):
+        error, kind = AttributeError, "attribute"
+    elif isinstance(suppressed, _IndexError):
+        error, kind = IndexError, "index"
+    elif isinstance(suppressed, _KeyError):
+        error, kind = KeyError, "key"
+    else:
+        error = TypeError
+        reason = str(suppressed)
+        if ("object is not subscriptable" in reason) or ("does not support item" in reason):
+            kind, type_name = "container", get_type_name(ptr)
+        else:
+            kind, type_name = "operand", get_type_name(operators[index].operand)
+
+    message, path = _render_message(kind, name, _Site(operators), index, type_name)
+
+    if verbose:
+        representation = format_obj(obj, bounded=lightweight)
+        message += f"\nwhere _ is {type(obj)}:\n{representation}"
+    return error(message, None if lightweight else suppressed,
+                 path=path, index=index, type_name=get_type_name(ptr))
+
+
+def format_obj(obj: Any, *, bounded: bool = False) -> str:
+    """
+    Render an object for verbose error messages.
+
+    The formatting modules are imported on first use, as they are only needed for
+    diagnostics and noticeably slow down `import th`.
+
+    :param obj: The object to render.
+    :param bounded: If True, use a size-bounded `reprlib` representation instead of `pformat`.
+    :return: The representation of the object.
+    """
+    if bounded:
+        from reprlib import repr
+        return repr(obj)
+    from pprint import pformat
+    return pformat(obj)
+
+
+def get(obj: Any, path: PathHolder, *,
+        default: Union[Any, NilType] = Nil, verbose: bool = False,
+        lookup: Optional[Union[str, Callable[[Any], Any], "KeyLookup"]] = None,
+        lightweight: bool = False) -> Any:
+    """
+    Retrieve the value at a given path from the target object.
+
+    This function attempts to traverse the given `path` on the `obj`. If any attribute,
+    key, or index does not exist, and a `default` value is provided, the default value
+    will be returned. If no default is provided, a custom error (AttributeError, IndexError,
+    KeyError, or TypeError) is raised with additional path information.
+
+    :param obj: The target object from which to retrieve the value.
+    :param path: A PathHolder representing the series of accessors (attributes or items).
+    :param default: The default value to return if the path is not valid. Default is `Nil`.
+    :param verbose: If True, additional debug information will be included in the error message.
+    :param lookup: An optional key lookup policy for item accessors on mappings: "casefold",
+                   "normalize" (snake/camel/kebab-insensitive), a custom key normalizer,
+                   or a KeyLookup instance. Default is exact lookup.
+    :param lightweight: If True, the raised error keeps neither the original exception nor
+                        its traceback, and no frame involved in the lookup keeps `obj` alive;
+                        only bounded metadata (path, failing index, type name) is stored.
+    :return: The value retrieved from the object at the specified path.
+    :raises AttributeError: If an attribute in the path does not exist and no default is provided.
+    :raises IndexError: If an index in the path is out of range and no default is provided.
+    :raises KeyError: If a key in the path does not exist and no default is provided.
+    :raises TypeError: If an operation in the path is inappropriate for the object type and
+                       no default is provided.
+    """
+    key_lookup = None
+    if lookup is not None:
+        from ._lookup import get_lookup
+        key_lookup = get_lookup(lookup)
+    ptr = obj
+    for index, operator in enumerate(path):
+        try:
+            if (key_lookup is not None) and isinstance(operator, ItemAccessor):
+                ptr = key_lookup(ptr, operator.operand)
+            else:
+                ptr = operator(ptr)
+        except (_AttributeError, _IndexError, _KeyError, _TypeError) as suppressed:
+            if default is not Nil:
+                return default
+            error = make_error(suppressed, path.__name__, tuple(path), ptr, obj,
+                               index=index, verbose=verbose,
+                               lightweight=lightweight)
+            report_failure(error, operator, ptr)
+            if not lightweight:
+                raise error from None
+            break
+    else:
+        return ptr
+    # Raised outside of the except block so that the error has no __context__,
+    # and with the locals cleared so that the traceback does not retain the objects
+    obj = ptr = None
+    raise error
@@ -0,0 +1,307 @@
+import collections.abc
+import sys
+from inspect import getattr_static
+from typing import Any, ClassVar, Dict, Optional, Sequence, Tuple, Type, Union, get_type_hints
+
+from ._error import AttributeError, Error, IndexError, KeyError, TypeError, _AttributeError
+from ._utils import get_carets, get_indent
+from .operators import AttrAccessor, ItemAccessor, Operator
+
+if sys.version_info >= (3, 10):
+    from types import UnionType
+    _union_types: Tuple[Any, ...] = (Union, UnionType)
+else:
+    _union_types = (Union,)
+
+if sys.version_info >= (3, 9):
+    from typing import Annotated, get_args, get_origin
+else:  # pragma: no cover
+    from typing import get_args, get_origin
+    Annotated = object()
+
+__all__ = ("check_path",)
+
+
+class _Unknown:
+    """
+    Marks a type that cannot be checked any further.
+    """
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the marker.
+
+        :return: "<unknown>".
+        """
+        return "<unknown>"
+
+
+_unknown: Any = _Unknown()
+
+# The outcome of a step: True if it must succeed, False if it cannot succeed,
+# None if it may or may not succeed
+_Step = Tuple[Optional[bool], Any]
+
+
+def _type_name(tp: Any) -> str:
+    """
+    Return a readable name of a type hint.
+
+    :param tp: The type hint.
+    :return: The name of the type.
+    """
+    return tp.__name__ if isinstance(tp, type) else repr(tp).replace("typing.", "")
+
+
+def _hints(tp: Any) -> Dict[str, Any]:
+    """
+    Return the resolved type hints of a class, or an empty dict if they cannot be resolved.
+
+    :param tp: The class.
+    :return: The type hints.
+    """
+    try:
+        return get_type_hints(tp)
+    except Exception:
+        return dict(getattr(tp, "__annotations__", {}))
+
+
+def _unwrap(tp: Any) -> Tuple[Any, bool]:
+    """
+    Strip `Annotated`, `ClassVar` and `Optional` from a type hint.
+
+    :param tp: The type hint.
+    :return: The inner type (or `_unknown` for non-optional unions, `Any` and untyped values),
+             and whether the value may be None.
+    """
+    nullable = False
+    while True:
+        origin = get_origin(tp)
+        if (origin is Annotated) or (origin is ClassVar):
+            tp = get_args(tp)[0]
+        elif origin in _union_types:
+            args = [x for x in get_args(tp) if x is not type(None)]
+            nullable = nullable or (len(args) < len(get_args(tp)))
+            if len(args) != 1:
+                return _unknown, nullable
+            tp = args[0]
+        else:
+            break
+    if (tp is Any) or (tp is _unknown) or not ((origin is not None) or isinstance(tp, type)):
+        return _unknown, nullable
+    return tp, nullable
+
+
+def _is_typeddict(tp: Any) -> bool:
+    """
+    Check whether a type hint is a TypedDict.
+
+    :param tp: The type hint.
+    :return: True for TypedDict classes.
+    """
+    return isinstance(tp, type) and issubclass(tp, dict) and hasattr(tp, "__total__")
+
+
+def _is_closed(tp: Type[Any]) -> bool:
+    """
+    Check whether the attributes of a class are fully described by its declaration,
+    i.e. instances cannot have attributes that are not declared.
+
+    Annotations alone do not close a class, as `__init__` (or `__post_init__` of
+    a dataclass) may set other attributes.
+
+    :param tp: The class.
+    :return: True for named tuples and classes (including dataclasses) whose instances have
+             `__slots__` and no `__dict__`.
+    """
+    if hasattr(tp, "_fields"):
+        return True
+    return ("__slots__" in vars(tp)) and not any("__dict__" in vars(x) for x in tp.__mro__)
+
+
+def _attr_step(tp: Any, name: str) -> _Step:
+    """
+    Check an attribute access on a value of the given type.
+
+    :param tp: The type of the value.
+    :param name: The attribute name.
+    :return: Whether the attribute exists (True, False or None if unknown) and its type.
+    """
+    if _is_typeddict(tp):
+        return (True, _unknown) if hasattr(dict, name) else (False, None)
+
+    cls = get_origin(tp) or tp
+    if not isinstance(cls, type):
+        return None, _unknown
+    hints = _hints(cls)
+    if name in hints:
+        return True, hints[name]
+    try:
+        attribute = getattr_static(cls, name)
+    except _AttributeError:
+        return (False, None) if _is_closed(cls) else (None, _unknown)
+    if isinstance(attribute, property) and (attribute.fget is not None):
+        return True, _hints(attribute.fget).get("return", _unknown)
+    return True, _unknown
+
+
+def _item_step(tp: Any, key: Any, lookup: bool) -> _Step:
+    """
+    Check an item access on a value of the given type.
+
+    :param tp: The type of the value.
+    :param key: The key or index.
+    :param lookup: True if keys are resolved through a lookup policy.
+    :return: Whether the item exists (True, False or None if unknown) and its type.
+    """
+    if _is_typeddict(tp):
+        if lookup:
+            return None, _unknown
+        hints = _hints(tp)
+        required = getattr(tp, "__required_keys__", set(hints) if tp.__total__ else set())
+        if key in required:
+            return True, hints[key]
+        return (None, hints[key]) if (key in hints) else (False, None)
+
+    cls = get_origin(tp) or tp
+    args = get_args(tp)
+    if not isinstance(cls, type):
+        return None, _unknown
+    if not hasattr(cls, "__getitem__"):
+        return False, None
+
+    if issubclass(cls, collections.abc.Mapping):
+        return None, (args[1] if len(args) == 2 else _unknown)
+
+    if issubclass(cls, tuple) and (args or hasattr(cls, "_fields")):
+        if not args:
+            args = tuple(_hints(cls).values())
+        if (len(args) == 2) and (args[1] is Ellipsis):
+            return _sequence_step(tp, key, args[0])
+        if isinstance(key, slice):
+            return True, _unknown
+        if type(key) is not int:
+            return _index_step(key)
+        if -len(args) <= key < len(args):
+            return True, args[key]
+        return False, None
+
+    if issubclass(cls, (str, bytes)):
+        return _sequence_step(tp, key, cls)
+    if issubclass(cls, collections.abc.Sequence):
+        return _sequence_step(tp, key, args[0] if args else _unknown)
+    return None, _unknown
+
+
+def _sequence_step(tp: Any, key: Any, item_type: Any) -> _Step:
+    """
+    Check an item access on a sequence of variable length.
+
+    :param tp: The type of the sequence.
+    :param key: The index or slice.
+    :param item_type: The type of the items.
+    :return: Whether the item exists (True, False or None if unknown) and its type.
+    """
+    if isinstance(key, slice):
+        return True, tp
+    if type(key) is not int:
+        return _index_step(key)
+    return None, item_type
+
+
+def _index_step(key: Any) -> _Step:
+    """
+    Check a sequence access with a key that is not an int.
+
+    :param key: The key.
+    :return: An unknown outcome for keys that may be used as indexes (`True`, NumPy
+             integers and other types with `__index__`), or an impossible one otherwise.
+    """
+    return (None, _unknown) if hasattr(type(key), "__index__") else (False, None)
+
+
+def _impossible(operator: Operator, tp: Any, path: str, prev: str, index: int) -> Error:
+    """
+    Build the error for a step that the schema does not allow.
+
+    :param operator: The operator of the step.
+    :param tp: The type the step is applied to.
+    :param path: The string representation of the path.
+    :param prev: The string representation of the path before the step.
+    :param index: The index of the step.
+    :return: An AttributeError, IndexError, KeyError or TypeError with a caret message.
+    """
+    type_name = _type_name(tp)
+    if isinstance(operator, AttrAccessor):
+        indent = get_indent(AttributeError, prev)
+        carets = get_carets(operator.operand, repr=str)
+        message = f"{path}\n{indent}{carets} does not exist in {type_name}"
+        return AttributeError(message, None, path=path, index=index, type_name=type_name)
+
+    if _is_typeddict(tp):
+        indent = get_indent(KeyError, prev)
+        carets = get_carets(operator.operand)
+        message = f"{path}\n{indent}{carets} does not exist in {type_name}"
+        return KeyError(message, None, path=path, index=index, type_name=type_name)
+
+    cls = get_origin(tp) or tp
+    if hasattr(cls, "__getitem__") and (type(operator.operand) is int):
+        indent = get_indent(IndexError, prev)
+        carets = get_carets(operator.operand)
+        message = f"{path}\n{indent}{carets} out of range for {type_name}"
+        return IndexError(message, None, path=path, index=index, type_name=type_name)
+
+    if hasattr(cls, "__getitem__"):
+        indent = get_indent(TypeError, prev)
+        carets = get_carets(operator.operand)
+        message = f"{path}\n{indent}{carets} inappropriate type for {type_name} " \
+                  f"({type(operator.operand).__name__})"
+    else:
+        indent = get_indent(TypeError)
+        carets = get_carets(prev, repr=str)
+        message = f"{path}\n{indent}{carets} inappropriate type ({type_name})"
+    return TypeError(message, None, path=path, index=index, type_name=type_name)
+
+
+def check_path(name: str, operators: Sequence[Operator], schema: Any, *,
+               lookup: bool = False) -> int:
+    """
+    Check a path against the type hints of its root.
+
+    Attributes are checked against dataclasses, named tuples and annotated classes, keys
+    against TypedDicts, and items against tuples, sequences and mappings. The check stops
+    at the first step whose type is not known (e.g. `Any` or an unannotated attribute).
+
+    :param name: The name of the path root, e.g. "_".
+    :param operators: The operators of the path.
+    :param schema: The type of the root object.
+    :param lookup: True if item keys are resolved through a lookup policy.
+    :return: The number of leading steps that must succeed according to the schema.
+    :raises AttributeError: If the schema does not allow an attribute of the path.
+    :raises IndexError: If the schema does not allow an index of the path.
+    :raises KeyError: If the schema does not allow a key of the path.
+    :raises TypeError: If the schema does not allow an item access of the path.
+    """
+    path = name + "".join(str(x) for x in operators)
+    prev = name
+    guaranteed = 0
+    certain = True
+    tp = schema
+    for index, operator in enumerate(operators):
+        tp, nullable = _unwrap(tp)
+        if tp is _unknown:
+            break
+        if isinstance(operator, AttrAccessor):
+            exists, next_tp = _attr_step(tp, operator.operand)
+        elif isinstance(operator, ItemAccessor):
+            exists, next_tp = _item_step(tp, operator.operand, lookup)
+        else:
+            break
+        if exists is False:
+            raise _impossible(operator, tp, path, prev, index)
+        certain = certain and (exists is True) and not nullable
+        if certain:
+            guaranteed = index + 1
+        tp = next_tp
+        prev += str(operator)
+    return guaranteed
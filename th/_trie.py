@@ -0,0 +1,108 @@
+from typing import Any, List, Optional, Tuple, TypeVar, cast
+
+from ._error import Error
+from ._path_holder import PathHolder
+from ._resolver import make_error, report_failure
+from .operators import Operator
+
+__all__ = ("TrieNode", "LabeledTrieNode",)
+
+_T = TypeVar("_T", bound="TrieNode")
+_L = TypeVar("_L", bound="LabeledTrieNode")
+
+
+class TrieNode:
+    """
+    A node of a prefix trie of paths, keyed by operators.
+
+    Paths that share a prefix share the nodes of that prefix, which lets callers resolve
+    (or rebuild) every shared prefix once. Operators match when they are equal and their
+    operands have the same type, so `_[1]` and `_[True]` are kept apart.
+    """
+
+    __slots__ = ("operator", "children",)
+
+    def __init__(self, operator: Optional[Operator] = None) -> None:
+        """
+        Initialize the TrieNode with the operator that leads to it.
+
+        :param operator: The operator applied to the parent's value, None for the root.
+        """
+        self.operator = operator
+        self.children: List[Any] = []
+
+    def child(self: _T, operator: Operator) -> _T:
+        """
+        Return the child node for an operator, creating it if needed.
+
+        :param operator: The operator applied after this node.
+        :return: The child node.
+        """
+        for child in self.children:
+            if (type(child.operator) is type(operator)) and \
+               (type(child.operator.operand) is type(operator.operand)) and \
+               (child.operator == operator):
+                return cast(_T, child)
+        node = self.__class__(operator)
+        self.children.append(node)
+        return node
+
+
+class LabeledTrieNode(TrieNode):
+    """
+    A trie node that remembers the first path going through it.
+
+    Failures of the node's operator are reported in the context of that path, with the
+    same caret messages as `th.get`.
+    """
+
+    __slots__ = ("name", "operators", "index",)
+
+    def __init__(self, operator: Optional[Operator] = None) -> None:
+        """
+        Initialize the LabeledTrieNode with the operator that leads to it.
+
+        :param operator: The operator applied to the parent's value, None for the root.
+        """
+        super().__init__(operator)
+        self.name = ""
+        self.operators: Tuple[Operator, ...] = ()
+        self.index = 0
+
+    def insert(self: _L, path: PathHolder) -> _L:
+        """
+        Insert a path below this node.
+
+        :param path: The path to insert.
+        :return: The node the path ends at.
+        """
+        node = self
+        operators = tuple(path)
+        for index, operator in enumerate(operators):
+            node = node.child(operator)
+            if not node.operators:
+                node.name, node.operators, node.index = path.__name__, operators, index
+        return node
+
+    @property
+    def operand(self) -> Any:
+        """
+        Return the operand of this node's operator.
+
+        :return: The operand.
+        """
+        assert self.operator is not None
+        return self.operator.operand
+
+    def fail(self, suppressed: Exception, target: Any) -> Error:
+        """
+        Build a th error for a failure of this node's operator, to be raised.
+
+        :param suppressed: The original exception.
+        :param target: The object the operator was applied to.
+        :return: The th error.
+        """
+        error = make_error(suppressed, self.name, self.operators, target, target,
+                           index=self.index)
+        report_failure(error, self.operators[self.index], target)
+        return error
@@ -0,0 +1,183 @@
+from copy import copy
+from typing import Any, Iterable, List, Mapping, Optional, Tuple, Union
+
+from ._error import _AttributeError, _IndexError, _KeyError, _TypeError
+from ._frozen import FrozenDict
+from ._path_holder import PathHolder
+from ._trie import LabeledTrieNode
+from .operators import AttrAccessor, ItemAccessor, Operator
+
+__all__ = ("set", "update",)
+
+_Errors = (_AttributeError, _IndexError, _KeyError, _TypeError)
+
+
+class _Node(LabeledTrieNode):
+    """
+    A node of the trie of paths to update, holding the new value if it is assigned.
+    """
+
+    __slots__ = ("assigned", "value",)
+
+    def __init__(self, operator: Optional[Operator] = None) -> None:
+        super().__init__(operator)
+        self.assigned = False
+        self.value: Any = None
+
+
+def _build_trie(changes: Iterable[Tuple[PathHolder, Any]]) -> _Node:
+    """
+    Build the trie of paths to update; later assignments to the same path win.
+
+    :param changes: The paths and their new values.
+    :return: The root node.
+    """
+    root = _Node()
+    for path, value in changes:
+        node = root.insert(path)
+        node.assigned, node.value = True, value
+    return root
+
+
+def _replace(target: Any, changes: List[Tuple[_Node, Any]]) -> Any:
+    """
+    Return a shallow copy of the target with some items and attributes replaced.
+
+    Immutable containers (tuples, named tuples, frozen dicts and frozen dataclasses)
+    are rebuilt instead of copied.
+
+    :param target: The container to copy.
+    :param changes: The nodes whose operators select the items/attributes, with new values.
+    :return: The new container.
+    """
+    if isinstance(target, (FrozenDict, tuple)):
+        return _rebuild_immutable(target, changes)
+
+    params = getattr(target, "__dataclass_params__", None)
+    if (params is not None) and params.frozen:
+        from dataclasses import fields, replace
+        init = {x.name: x.init for x in fields(target)}
+        for node, _value in changes:
+            if not isinstance(node.operator, AttrAccessor):
+                raise node.fail(_TypeError(f"{type(target).__name__!r} object does not "
+                                           "support item assignment"), target)
+            if node.operand not in init:
+                raise node.fail(_AttributeError(f"{type(target).__name__!r} object has no "
+                                                f"attribute {node.operand!r}"), target)
+            if not init[node.operand]:
+                raise node.fail(_TypeError(f"{type(target).__name__!r} object does not "
+                                           "support item assignment to init=False field "
+                                           f"{node.operand!r}"), target)
+        return replace(target, **{node.operand: value for node, value in changes})
+
+    new = target.copy() if type(target) in (dict, list) else copy(target)
+    for node, value in changes:
+        try:
+            if isinstance(node.operator, AttrAccessor):
+                setattr(new, node.operand, value)
+            else:
+                new[node.operand] = value
+        except _Errors as suppressed:
+            raise node.fail(suppressed, target) from None
+    return new
+
+
+def _rebuild_immutable(target: Any, changes: List[Tuple[_Node, Any]]) -> Any:
+    """
+    Rebuild a tuple, named tuple or frozen dict with some items and attributes replaced.
+
+    :param target: The container to rebuild.
+    :param changes: The nodes whose operators select the items/attributes, with new values.
+    :return: The new container.
+    """
+    fields = getattr(target, "_fields", ())
+    for node, _value in changes:
+        if isinstance(node.operator, AttrAccessor) and (node.operand not in fields):
+            raise node.fail(_AttributeError(f"{type(target).__name__!r} object has no "
+                                            f"attribute {node.operand!r}"), target)
+
+    if isinstance(target, FrozenDict):
+        try:
+            return target.replace({node.operand: value for node, value in changes})
+        except _Errors as suppressed:
+            raise changes[0][0].fail(suppressed, target) from None
+
+    values = list(target)
+    for node, value in changes:
+        try:
+            if isinstance(node.operator, AttrAccessor):
+                values[fields.index(node.operand)] = value
+            else:
+                values[node.operand] = value
+        except _Errors as suppressed:
+            raise node.fail(suppressed, target) from None
+    if fields:
+        return target._make(values)
+    return tuple(values) if (type(target) is tuple) else type(target)(values)
+
+
+def _apply(node: _Node, target: Any) -> Any:
+    """
+    Apply the updates of a trie node to the target, copying only touched containers.
+
+    :param node: The trie node.
+    :param target: The current value at the node.
+    :return: The updated value.
+    """
+    if node.assigned:
+        target = node.value
+    if not node.children:
+        return target
+
+    changes = []
+    for child in node.children:
+        if not isinstance(child.operator, (AttrAccessor, ItemAccessor)):
+            # Selectors such as `th.match` do not identify a single item to replace
+            raise child.fail(_TypeError(f"{type(target).__name__!r} object does not "
+                                        "support item assignment"), target)
+        if child.assigned:
+            current = None
+        else:
+            try:
+                current = child.operator(target)
+            except _Errors as suppressed:
+                raise child.fail(suppressed, target) from None
+        changes.append((child, _apply(child, current)))
+    return _replace(target, changes)
+
+
+def update(obj: Any, changes: Union[Mapping[PathHolder, Any], Iterable[Tuple[PathHolder, Any]]]
+           ) -> Any:
+    """
+    Return a copy of the object with the values at the given paths replaced.
+
+    The object is not modified. Only the containers along the touched paths are copied
+    (shallowly); every untouched subtree is shared between the original and the copy.
+    All paths are applied in a single traversal, and paths that share a prefix copy
+    that prefix once. When a path is assigned together with paths below it, the value
+    is assigned first and the paths below are applied on top of (a copy of) it.
+
+    :param obj: The target object.
+    :param changes: A mapping (or an iterable of pairs) of paths to their new values.
+    :return: The updated copy of the object.
+    :raises AttributeError: If an attribute along a path does not exist or cannot be set.
+    :raises IndexError: If an index along a path is out of range.
+    :raises KeyError: If a key along a path does not exist.
+    :raises TypeError: If a container along a path does not support the operation.
+    """
+    items = changes.items() if isinstance(changes, Mapping) else changes
+    return _apply(_build_trie(items), obj)
+
+
+def set(obj: Any, path: PathHolder, value: Any) -> Any:
+    """
+    Return a copy of the object with the value at the given path replaced.
+
+    See `th.update` for details.
+
+    :param obj: The target object.
+    :param path: A PathHolder representing the series of accessors.
+    :param value: The new value.
+    :return: The updated copy of the object.
+    """
+    return update(obj, [(path, value)])
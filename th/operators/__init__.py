@@ -1,16 +1,49 @@
-from typing import Any
+import sys
+from typing import Any, Dict, Tuple
 
 from ._operator import Operator
 
 __all__ = ("Operator", "AttrAccessor", "ItemAccessor",)
 
+_missing = object()
+
+_modules = sys.modules
+
+# Whether a type has a `dtype` (i.e. may be a structured array), remembered per type
+_dtype_types: Dict[type, bool] = {}
+_DTYPE_TYPES_SIZE = 1024
+
+
+def _has_field(target: Any, name: str) -> bool:
+    """
+    Check whether the target is a structured array (NumPy-like) with the given field.
+
+    Callers skip the check unless NumPy is imported, so ordinary objects pay nothing.
+
+    :param target: The object to inspect.
+    :param name: The field name.
+    :return: True if the target's dtype declares the field.
+    """
+    cls = type(target)
+    has_dtype = _dtype_types.get(cls)
+    if has_dtype is None:
+        if len(_dtype_types) >= _DTYPE_TYPES_SIZE:
+            _dtype_types.clear()
+        has_dtype = _dtype_types[cls] = hasattr(cls, "dtype")
+    if not has_dtype:
+        return False
+    names = getattr(getattr(target, "dtype", None), "names", None)
+    return (names is not None) and (name in names)
+
 
 class AttrAccessor(Operator):
     """
     Accesses an attribute of a target object using the stored operand.
 
     This operator retrieves an attribute from a target object, where the operand
-    represents the attribute's name.
+    represents the attribute's name. Fields of NumPy structured arrays are accessible
+    as attributes as well and resolve to zero-copy column views (`arr["field"]`); a field
+    takes precedence over an array attribute of the same name (e.g. `max` or `size`).
     """
 
     def __call__(self, target: Any) -> Any:
@@ -21,8 +54,29 @@ class AttrAccessor(Operator):
         :return: The value of the attribute.
         :raises AttributeError: If the attribute does not exist.
         """
+        if ("numpy" in _modules) and _has_field(target, self._operand):
+            return target[self._operand]
         return getattr(target, self._operand)
 
+    def probe(self, target: Any) -> Tuple[bool, Any]:
+        """
+        Retrieve the attribute from the target without raising if it does not exist.
+
+        :param target: The target object from which the attribute will be retrieved.
+        :return: `(True, value)`, or `(False, exception)` describing the failure, e.g.
+                 `AttributeError(...)` if it does not exist.
+        """
+        if ("numpy" in _modules) and _has_field(target, self._operand):
+            return super().probe(target)
+        try:
+            value = getattr(target, self._operand, _missing)
+        except (IndexError, KeyError, TypeError) as exception:  # raised by properties
+            return False, exception
+        if value is not _missing:
+            return True, value
+        message = f"{type(target).__name__!r} object has no attribute {self._operand!r}"
+        return False, AttributeError(message)
+
     def __str__(self) -> str:
         """
         Return a string representation of the attribute access operation.
@@ -51,6 +105,30 @@ class ItemAccessor(Operator):
         """
         return target[self._operand]
 
+    def probe(self, target: Any) -> Tuple[bool, Any]:
+        """
+        Retrieve the item from the target, detecting missing keys of dicts and
+        out-of-range indexes of lists and tuples without raising.
+
+        :param target: The target object from which the item will be retrieved.
+        :return: `(True, value)` on success, or `(False, exception)` describing the failure.
+        """
+        key = self._operand
+        cls = type(target)
+        if cls is dict:
+            try:
+                value = target.get(key, _missing)
+            except TypeError:
+                return super().probe(target)
+            if value is _missing:
+                return False, KeyError(key)
+            return True, value
+        if ((cls is list) or (cls is tuple)) and (type(key) is int):
+            if -len(target) <= key < len(target):
+                return True, target[key]
+            return False, IndexError(f"{cls.__name__} index out of range")
+        return super().probe(target)
+
     def __str__(self) -> str:
         """
         Return a string representation of the item access operation.
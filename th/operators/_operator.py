@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Tuple
 
 __all__ = ("Operator",)
 
@@ -41,6 +41,20 @@ class Operator(ABC):
         """
         raise NotImplementedError()
 
+    def probe(self, target: Any) -> Tuple[bool, Any]:
+        """
+        Apply the operator to the target, reporting a failure instead of raising it.
+
+        Subclasses override this to detect common failures without raising exceptions.
+
+        :param target: The target on which the operator is applied.
+        :return: `(True, result)` on success, or `(False, exception)` describing the failure.
+        """
+        try:
+            return True, self(target)
+        except (AttributeError, IndexError, KeyError, TypeError) as exception:
+            return False, exception
+
     def __eq__(self, other: Any) -> bool:
         """
         Compare two Operator instances for equality.
@@ -50,6 +64,15 @@ class Operator(ABC):
         """
         return isinstance(other, self.__class__) and (self.__dict__ == other.__dict__)
 
+    def __hash__(self) -> int:
+        """
+        Return a hash of the operator based on its class and operand.
+
+        :return: The hash value.
+        :raises TypeError: If the operand is not hashable.
+        """
+        return hash((self.__class__, self._operand))
+
     def __repr__(self) -> str:
         """
         Return a formal string representation of the Operator instance.